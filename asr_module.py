@@ -3,15 +3,305 @@ Automatic Speech Recognition (ASR) Module
 Converts Indic language audio to native script text using AI4Bharat IndicConformer
 """
 
+import os
+import itertools
+import logging
+import multiprocessing
+import threading
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 import torch
 import torchaudio
-import librosa
 import soundfile as sf
 import numpy as np
 from transformers import AutoModel, pipeline
-from typing import Optional, Union, Tuple
+from typing import List, Optional, Union, Tuple
 import warnings
-warnings.filterwarnings('ignore')
+
+from audio_io import decode_audio
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = prange = None
+
+logger = logging.getLogger(__name__)
+
+# Loaded ASR models keyed by (model_name, device, dtype, quantized), shared across
+# IndicASR instances; held weakly, so weights are freed once no instance uses them
+_MODEL_CACHE: "weakref.WeakValueDictionary[Tuple[str, str, torch.dtype, bool], object]" = weakref.WeakValueDictionary()
+
+
+def clear_model_cache():
+    """Forget cached ASR weights, so the next IndicASR loads its own copy"""
+    _MODEL_CACHE.clear()
+
+
+def configure_cpu_threads(num_threads: Optional[int] = None):
+    """
+    Pin CPU inference to num_threads intra-op threads, one inter-op thread,
+    and oneDNN kernels
+    
+    Applies process-wide, so it is left to servers that share the machine
+    with other workers; CLI runs keep PyTorch's default of every core.
+    
+    Args:
+        num_threads: Intra-op threads (default: half the cores)
+    """
+    torch.set_num_threads(num_threads or max(1, (os.cpu_count() or 1) // 2))
+    torch.backends.mkldnn.enabled = True
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Can only be set once, before any inter-op parallel work has started
+        pass
+
+
+def _normalize_preemphasis_numpy(audio: np.ndarray, coef: float) -> np.ndarray:
+    """NumPy version of _normalize_preemphasis, written in place into one buffer"""
+    out = np.empty_like(audio)
+    if audio.size == 0:
+        return out
+    peak = max(float(audio.max()), float(-audio.min()), 1e-8)
+    out[0] = audio[0]
+    np.multiply(audio[:-1], -coef, out=out[1:])
+    out[1:] += audio[1:]
+    out *= 1.0 / peak
+    return out
+
+
+if njit is not None:
+    @njit(fastmath=True, cache=True)
+    def _normalize_preemphasis_numba(audio, coef):
+        out = np.empty_like(audio)
+        if audio.size == 0:
+            return out
+        peak = 1e-8
+        for i in range(audio.size):
+            a = abs(audio[i])
+            if a > peak:
+                peak = a
+        inv = 1.0 / peak
+        out[0] = audio[0] * inv
+        for i in range(1, audio.size):
+            out[i] = (audio[i] - coef * audio[i - 1]) * inv
+        return out
+else:
+    _normalize_preemphasis_numba = None
+
+
+def _normalize_preemphasis(audio: np.ndarray, coef: float = 0.97) -> np.ndarray:
+    """
+    Peak normalize and pre-emphasize a waveform in a single output pass
+    
+    Uses a Numba kernel when numba is installed, otherwise NumPy ufuncs.
+    
+    Args:
+        audio: Mono waveform
+        coef: Pre-emphasis coefficient
+        
+    Returns:
+        Normalized, pre-emphasized float32 waveform
+    """
+    audio = np.ascontiguousarray(audio, dtype=np.float32)
+    if _normalize_preemphasis_numba is not None:
+        return _normalize_preemphasis_numba(audio, np.float32(coef))
+    return _normalize_preemphasis_numpy(audio, coef)
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _frame_peaks_numba(audio, frame_length):
+        n_frames = (audio.size + frame_length - 1) // frame_length
+        peaks = np.empty(n_frames, dtype=audio.dtype)
+        for f in prange(n_frames):
+            end = min((f + 1) * frame_length, audio.size)
+            peak = 0.0
+            for i in range(f * frame_length, end):
+                a = abs(audio[i])
+                if a > peak:
+                    peak = a
+            peaks[f] = peak
+        return peaks
+else:
+    _frame_peaks_numba = None
+
+
+def _frame_peaks(audio: np.ndarray, frame_length: int) -> np.ndarray:
+    """
+    Peak absolute amplitude of each frame (the last frame may be short)
+    
+    Uses a parallel Numba kernel when numba is installed, which avoids
+    materializing |audio|; otherwise a single NumPy reduceat pass.
+    
+    Args:
+        audio: Mono waveform, non-empty
+        frame_length: Number of samples per frame
+        
+    Returns:
+        Per-frame peak envelope
+    """
+    if _frame_peaks_numba is not None:
+        return _frame_peaks_numba(np.ascontiguousarray(audio, dtype=np.float32), frame_length)
+    return np.maximum.reduceat(np.abs(audio), np.arange(0, audio.size, frame_length))
+
+
+def _trim_silence(
+    audio: np.ndarray,
+    top_db: float = 20,
+    frame_length: int = 512
+) -> np.ndarray:
+    """
+    Trim leading and trailing silence using a per-frame peak threshold
+    
+    Args:
+        audio: Mono waveform
+        top_db: Frames quieter than the peak by more than this are silence
+        frame_length: Number of samples per frame
+        
+    Returns:
+        Trimmed waveform (a view of the input)
+    """
+    if audio.size == 0:
+        return audio
+    
+    # Peak amplitude of each frame in one pass, no STFT
+    envelope = _frame_peaks(audio, frame_length)
+    threshold = envelope.max() * 10 ** (-top_db / 20)
+    voiced = np.flatnonzero(envelope > threshold)
+    if voiced.size == 0:
+        return audio
+    
+    return audio[voiced[0] * frame_length:(voiced[-1] + 1) * frame_length]
+
+
+def _vad_segments(
+    audio: np.ndarray,
+    sampling_rate: int,
+    top_db: float = 40,
+    frame_length: int = 512,
+    min_silence_s: float = 0.3,
+    max_silence_s: float = 1.0,
+    max_segment_s: float = 30,
+    min_segment_s: float = 1.0
+) -> List[np.ndarray]:
+    """
+    Split a waveform at pauses, detected with the per-frame peak envelope
+    
+    Voiced runs are packed into segments of up to max_segment_s, cutting
+    at pauses of at least min_silence_s and always at pauses longer than
+    max_silence_s, so long silences are never carried into a segment.
+    Segments shorter than min_segment_s are merged into a neighbour. A
+    stretch with no pause can exceed max_segment_s; callers window it with
+    _split_chunks.
+    
+    Args:
+        audio: Mono waveform
+        sampling_rate: Sampling rate of the waveform
+        top_db: Frames quieter than the peak by more than this are silence
+        frame_length: Number of samples per frame
+        min_silence_s: Shortest pause that may separate two segments
+        max_silence_s: Longest pause that may be kept inside a segment
+        max_segment_s: Longest packed segment in seconds
+        min_segment_s: Shortest segment kept on its own
+        
+    Returns:
+        List of waveform views in temporal order; the whole input if it has
+        no voiced frames
+    """
+    if audio.size == 0:
+        return [audio]
+    
+    envelope = _frame_peaks(audio, frame_length)
+    voiced = envelope > envelope.max() * 10 ** (-top_db / 20)
+    if not voiced.any():
+        return [audio]
+    
+    # [start, end) frame index of each voiced run
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], voiced.view(np.int8), [0]))))
+    runs = edges.reshape(-1, 2)
+    frames_per_s = sampling_rate / frame_length
+    min_gap = max(1, int(min_silence_s * frames_per_s))
+    max_gap = max(min_gap, int(max_silence_s * frames_per_s))
+    max_frames = max(1, int(max_segment_s * frames_per_s))
+    min_frames = int(min_segment_s * frames_per_s)
+    
+    spans = []
+    seg_start, seg_end = runs[0]
+    for start, end in runs[1:]:
+        gap = start - seg_end
+        if gap < min_gap or (gap <= max_gap and end - seg_start <= max_frames):
+            seg_end = end
+        else:
+            spans.append((seg_start, seg_end))
+            seg_start, seg_end = start, end
+    spans.append((seg_start, seg_end))
+    
+    # Fold slivers into the previous segment (a short first one into the next)
+    merged = []
+    for start, end in spans:
+        if merged and (end - start < min_frames or merged[-1][1] - merged[-1][0] < min_frames):
+            merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    
+    return [
+        audio[start * frame_length:min(end * frame_length, audio.size)]
+        for start, end in merged
+    ]
+
+
+def _split_chunks(
+    audio: np.ndarray,
+    sampling_rate: int,
+    chunk_length_s: float = 30,
+    overlap_s: float = 1
+) -> List[np.ndarray]:
+    """
+    Split a waveform into fixed-length windows that overlap slightly
+    
+    Args:
+        audio: Mono waveform
+        sampling_rate: Sampling rate of the waveform
+        chunk_length_s: Window length in seconds
+        overlap_s: Overlap between consecutive windows in seconds
+        
+    Returns:
+        List of waveform views; a single entry if the audio is short
+    """
+    chunk_len = int(chunk_length_s * sampling_rate)
+    step = chunk_len - int(overlap_s * sampling_rate)
+    if chunk_len <= 0 or step <= 0 or len(audio) <= chunk_len:
+        return [audio]
+    
+    starts = range(0, len(audio) - chunk_len + step, step)
+    return [audio[start:start + chunk_len] for start in starts]
+
+
+def _merge_chunk_texts(texts: List[str], max_overlap_words: int = 8) -> str:
+    """
+    Join chunk transcripts, dropping words repeated across chunk overlaps
+    
+    Args:
+        texts: Transcripts of consecutive overlapping chunks
+        max_overlap_words: Longest repeated word run to look for
+        
+    Returns:
+        Combined transcript
+    """
+    words: List[str] = []
+    for text in texts:
+        chunk_words = text.split()
+        limit = min(max_overlap_words, len(words), len(chunk_words))
+        overlap = 0
+        for n in range(limit, 0, -1):
+            if words[-n:] == chunk_words[:n]:
+                overlap = n
+                break
+        words.extend(chunk_words[overlap:])
+    return " ".join(words)
 
 
 class IndicASR:
@@ -23,7 +313,9 @@ class IndicASR:
         self,
         model_name: str,
         device: Optional[str] = None,
-        sampling_rate: int = 16000
+        sampling_rate: int = 16000,
+        int8_cpu: bool = False,
+        dtype: Optional[torch.dtype] = None
     ):
         """
         Initialize the ASR model
@@ -32,37 +324,64 @@ class IndicASR:
             model_name: HuggingFace model identifier
             device: Device to run inference on ('cuda', 'cpu', or None for auto)
             sampling_rate: Target sampling rate for audio
+            int8_cpu: Dynamically quantize IndicConformer to int8 when on CPU
+                (float32 only)
+            dtype: Weight/compute dtype (default: float16 on CUDA, float32 on
+                CPU); torch.bfloat16 suits Ampere+ GPUs and AVX-512-BF16 CPUs
         """
         self.device = device or ('cuda' if torch.cuda.is_available() else 'cpu')
         self.sampling_rate = sampling_rate
         self.model_name = model_name
         self.is_whisper = "whisper" in model_name.lower()
+        # Half precision roughly doubles matmul throughput and halves weight traffic
+        self.dtype = dtype or (torch.float16 if self.device == 'cuda' else torch.float32)
+        quantize = int8_cpu and self.device == 'cpu' and self.dtype == torch.float32
+        
+        # Pinned float32 staging buffer for host-to-device copies on CUDA
+        self._pinned = None
+        self._pinned_lock = threading.Lock()
         
-        print(f"Loading ASR model: {model_name}")
-        print(f"Using device: {self.device}")
+        logger.debug("Loading ASR model: %s on %s", model_name, self.device)
+        
+        cache_key = (model_name, self.device, self.dtype, quantize)
+        cached = _MODEL_CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug("Reusing cached ASR model")
+            self.model = cached
+            return
         
         try:
             if self.is_whisper:
                 # Load Whisper model using pipeline
-                print("Loading Whisper model...")
-                self.model = pipeline(
-                    "automatic-speech-recognition",
-                    model=model_name,
-                    device=0 if self.device == 'cuda' else -1
-                )
-                print("Whisper model loaded successfully!")
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore')
+                    self.model = pipeline(
+                        "automatic-speech-recognition",
+                        model=model_name,
+                        device=0 if self.device == 'cuda' else -1,
+                        torch_dtype=self.dtype
+                    )
             else:
                 # Load IndicConformer model
-                print("Loading IndicConformer model...")
-                self.model = AutoModel.from_pretrained(
-                    model_name,
-                    trust_remote_code=True
-                )
-                self.model.to(self.device)
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore')
+                    self.model = AutoModel.from_pretrained(
+                        model_name,
+                        trust_remote_code=True
+                    )
+                self.model.to(self.device, dtype=self.dtype)
                 self.model.eval()
-                print("IndicConformer model loaded successfully!")
+                if quantize:
+                    # int8 GEMMs for the Linear/LSTM layers that dominate the Conformer
+                    logger.debug("Quantizing IndicConformer to int8")
+                    self.model = torch.ao.quantization.quantize_dynamic(
+                        self.model,
+                        {torch.nn.Linear, torch.nn.LSTM},
+                        dtype=torch.qint8
+                    )
             
-            print("ASR model loaded successfully!")
+            _MODEL_CACHE[cache_key] = self.model
+            logger.debug("ASR model loaded: %s", model_name)
             
         except Exception as e:
             raise RuntimeError(f"Failed to load ASR model: {str(e)}")
@@ -85,52 +404,87 @@ class IndicASR:
         target_sr = target_sr or self.sampling_rate
         
         try:
-            # Load audio using librosa for better compatibility
-            audio, sr = librosa.load(audio_path, sr=target_sr, mono=True)
-            
-            # Trim silence from beginning and end
-            audio, _ = librosa.effects.trim(audio, top_db=20)
-            
-            # Normalize audio with better method
-            audio = librosa.util.normalize(audio)
-            
-            # Apply pre-emphasis filter to boost high frequencies (improves speech recognition)
-            audio = np.append(audio[0], audio[1:] - 0.97 * audio[:-1])
-            
-            print(f"📂 Loaded audio: {audio_path}")
-            print(f"   Duration: {len(audio) / sr:.2f}s, Sample rate: {sr}Hz")
-            
-            return audio, sr
-            
+            # Decode with torchaudio; resampling then runs on the model's device
+            wav, sr = torchaudio.load(audio_path)
         except Exception as e:
-            print(f"Librosa load failed: {str(e)}")
+            logger.debug("torchaudio load failed, falling back to soundfile: %s", e)
             try:
-                # Fallback to soundfile directly
-                print("Attempting fallback to soundfile...")
-                audio, sr = sf.read(audio_path)
-                # Convert to float32 and mono if needed
-                if len(audio.shape) > 1:
-                    audio = np.mean(audio, axis=1)
-                audio = audio.astype(np.float32)
-                
-                # Resample if needed
-                if sr != target_sr:
-                    audio = librosa.resample(audio, orig_sr=sr, target_sr=target_sr)
-                    sr = target_sr
-                    
-                print(f"Fallback successful. Loaded audio: {audio_path}")
-                return audio, sr
+                # Fallback to soundfile for codecs torchaudio cannot decode
+                data, sr = sf.read(audio_path, dtype='float32', always_2d=True)
+                wav = torch.from_numpy(data.T)
             except Exception as e2:
-                import traceback
-                traceback.print_exc()
                 raise RuntimeError(f"Failed to load audio file: {repr(e)} | Fallback error: {repr(e2)}")
+        
+        # Convert to mono before preprocessing
+        wav = wav.mean(dim=0)
+        audio = self.preprocess_audio(wav, sr, target_sr)
+        sr = target_sr
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Loaded audio: %s (%.2fs at %dHz)", audio_path, len(audio) / sr, sr
+            )
+        
+        return audio, sr
+    
+    def preprocess_audio(
+        self,
+        audio: Union[np.ndarray, torch.Tensor],
+        sampling_rate: int,
+        target_sr: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Resample, trim, normalize and pre-emphasize a decoded waveform
+        
+        Args:
+            audio: Decoded waveform, mono or (samples, channels)
+            sampling_rate: Sampling rate of the input
+            target_sr: Target sampling rate (uses model's default if None)
+            
+        Returns:
+            Preprocessed mono waveform at the target sampling rate
+        """
+        if isinstance(audio, np.ndarray) and audio.ndim > 1:
+            audio = audio.mean(axis=1)
+        audio = self._resample(audio, sampling_rate, target_sr)
+        
+        # Trim silence from beginning and end
+        audio = _trim_silence(audio, top_db=20)
+        
+        # Peak normalize and apply pre-emphasis to boost high frequencies
+        # (improves speech recognition)
+        return _normalize_preemphasis(audio, coef=0.97)
+    
+    def _resample(
+        self,
+        audio: Union[np.ndarray, torch.Tensor],
+        orig_sr: int,
+        target_sr: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Resample mono audio with torchaudio on the model's device
+        
+        Args:
+            audio: Mono waveform as a numpy array or tensor
+            orig_sr: Sampling rate of the input
+            target_sr: Target sampling rate (uses model's default if None)
+            
+        Returns:
+            Resampled float32 numpy waveform
+        """
+        target_sr = target_sr or self.sampling_rate
+        wav = torch.as_tensor(audio, dtype=torch.float32)
+        if orig_sr != target_sr:
+            wav = torchaudio.functional.resample(wav.to(self.device), orig_sr, target_sr)
+        return wav.reshape(-1).cpu().numpy()
     
     def transcribe(
         self,
         audio_input: Union[str, np.ndarray],
         sampling_rate: Optional[int] = None,
         language_code: str = "hi",
-        decoding_type: str = "ctc"
+        decoding_type: str = "ctc",
+        chunk_length_s: int = 30
     ) -> str:
         """
         Transcribe audio to Indic text using IndicConformer
@@ -140,6 +494,7 @@ class IndicASR:
             sampling_rate: Sampling rate if audio_input is array
             language_code: Language code (e.g., 'hi', 'ta', 'te')
             decoding_type: Decoding method ('ctc' or 'rnnt')
+            chunk_length_s: Audio longer than this is transcribed in chunks
             
         Returns:
             Transcribed text in native Indic script
@@ -153,74 +508,340 @@ class IndicASR:
         
         # Ensure correct sampling rate
         if sr != self.sampling_rate:
-            audio = librosa.resample(
-                audio,
-                orig_sr=sr,
-                target_sr=self.sampling_rate
-            )
+            audio = self._resample(audio, sr)
             sr = self.sampling_rate
         
-        print(f"Transcribing audio with language: {language_code}...")
+        logger.debug("Transcribing audio with language: %s", language_code)
         
         try:
             if self.is_whisper:
                 # Whisper transcription using pipeline
                 # Pass audio array directly to avoid ffmpeg dependency
                 # The pipeline expects a dict with 'raw' and 'sampling_rate'
-                result = self.model({
-                    "raw": audio,
-                    "sampling_rate": sr
-                })
+                result = self.model(
+                    {
+                        "raw": audio,
+                        "sampling_rate": sr
+                    },
+                    chunk_length_s=chunk_length_s
+                )
                 transcription = result['text']
             else:
                 # IndicConformer transcription
-                # Convert to torch tensor and add batch dimension
-                wav_tensor = torch.from_numpy(audio).float()
-                
-                # Ensure mono audio
-                if len(wav_tensor.shape) > 1:
-                    wav_tensor = torch.mean(wav_tensor, dim=0, keepdim=True)
-                else:
-                    wav_tensor = wav_tensor.unsqueeze(0)
-                
-                # Move to device
-                wav_tensor = wav_tensor.to(self.device)
-                
-                # Perform ASR using IndicConformer's custom method
-                with torch.no_grad():
-                    transcription = self.model(wav_tensor, language_code, decoding_type)
-            
-            print(f"Transcription complete!")
-            print(f"   Text length: {len(transcription)} characters")
+                transcription = self._conformer_transcribe(
+                    audio, language_code, decoding_type, chunk_length_s
+                )
+            
+            logger.debug("Transcription complete: %d characters", len(transcription))
             
             return transcription
             
         except Exception as e:
             raise RuntimeError(f"Transcription failed: {str(e)}")
     
+    def transcribe_segmented(
+        self,
+        audio_input: Union[str, np.ndarray],
+        sampling_rate: Optional[int] = None,
+        language_code: str = "hi",
+        decoding_type: str = "ctc",
+        max_segment_s: float = 30,
+        batch_size: int = 8
+    ) -> str:
+        """
+        Transcribe audio split into pause-delimited segments
+        
+        Segments don't need each other's context, so they are transcribed
+        as one batch through transcribe_many instead of one long decode.
+        Segments longer than max_segment_s are windowed with overlap and
+        their window transcripts merged, as in transcribe.
+        
+        Args:
+            audio_input: Path to audio file or numpy array
+            sampling_rate: Sampling rate if audio_input is array
+            language_code: Language code (e.g., 'hi', 'ta', 'te')
+            decoding_type: Decoding method ('ctc' or 'rnnt')
+            max_segment_s: Longest segment (or window) in seconds
+            batch_size: Number of segments per Whisper forward
+            
+        Returns:
+            Transcribed text in native Indic script, segments in temporal order
+        """
+        if isinstance(audio_input, str):
+            audio, sr = self.load_audio(audio_input)
+        else:
+            audio = audio_input
+            sr = sampling_rate or self.sampling_rate
+        
+        if sr != self.sampling_rate:
+            audio = self._resample(audio, sr)
+        
+        segments = _vad_segments(audio, self.sampling_rate, max_segment_s=max_segment_s)
+        # Runs with no pause are windowed with overlap so no word is cut in two
+        windows = [_split_chunks(segment, self.sampling_rate, max_segment_s) for segment in segments]
+        logger.debug(
+            "Split audio into %d segment(s), %d window(s)",
+            len(segments), sum(map(len, windows))
+        )
+        
+        texts = iter(self.transcribe_many(
+            [window for segment_windows in windows for window in segment_windows],
+            language_code=language_code,
+            decoding_type=decoding_type,
+            batch_size=batch_size,
+            chunk_length_s=max_segment_s
+        ))
+        merged = (
+            _merge_chunk_texts(list(itertools.islice(texts, len(segment_windows))))
+            for segment_windows in windows
+        )
+        return " ".join(text for text in map(str.strip, merged) if text)
+    
+    def _conformer_transcribe(
+        self,
+        audio: np.ndarray,
+        language_code: str,
+        decoding_type: str,
+        chunk_length_s: int = 30
+    ) -> str:
+        """
+        Run IndicConformer over 30s windows with 1s overlap and merge the text
+        
+        Args:
+            audio: Mono waveform at the model's sampling rate
+            language_code: Language code (e.g., 'hi', 'ta', 'te')
+            decoding_type: Decoding method ('ctc' or 'rnnt')
+            chunk_length_s: Window length in seconds
+            
+        Returns:
+            Transcribed text in native Indic script
+        """
+        chunks = _split_chunks(audio, self.sampling_rate, chunk_length_s)
+        texts = []
+        
+        # Perform ASR using IndicConformer's custom method
+        with torch.no_grad(), torch.autocast(
+            self.device, dtype=self.dtype, enabled=self.dtype != torch.float32
+        ), self._pinned_lock if self.device == 'cuda' else nullcontext():
+            # Only the shared pinned buffer needs the lock; CPU forwards may run concurrently
+            for chunk in chunks:
+                # Audio is mono after preprocessing; add the batch dimension in place
+                assert chunk.ndim == 1, "expected mono audio"
+                wav_tensor = self._to_device(chunk).unsqueeze_(0)
+                # The remote-code forward runs feature extraction, the encoder
+                # and CTC/RNNT decoding and returns a string, so it can't be
+                # traced or compiled per (batch, length) bucket
+                texts.append(self.model(wav_tensor, language_code, decoding_type))
+        
+        if len(texts) == 1:
+            return texts[0]
+        return _merge_chunk_texts(texts)
+    
+    def _to_device(self, audio: np.ndarray) -> torch.Tensor:
+        """
+        Copy a waveform to the model's device
+        
+        Samples stay float32, since the model's STFT/log-mel front end can
+        overflow float16; autocast downcasts inside the model. On CUDA the
+        copy goes through a reused pinned buffer so it can run async.
+        The buffer is only reused after the previous forward has returned text,
+        so its transfer has completed. Callers hold self._pinned_lock.
+        
+        Args:
+            audio: Mono waveform
+            
+        Returns:
+            1-D float32 tensor on the model's device
+        """
+        host = torch.from_numpy(np.ascontiguousarray(audio, dtype=np.float32))
+        if self.device != 'cuda':
+            return host
+        
+        n = host.numel()
+        if self._pinned is None or self._pinned.numel() < n:
+            self._pinned = torch.empty(n, dtype=torch.float32, pin_memory=True)
+        staging = self._pinned[:n]
+        staging.copy_(host)
+        return staging.to(self.device, non_blocking=True)
+    
+    def transcribe_many(
+        self,
+        audios: List[np.ndarray],
+        sampling_rate: Optional[int] = None,
+        language_code: str = "hi",
+        decoding_type: str = "ctc",
+        batch_size: int = 8,
+        chunk_length_s: int = 30
+    ) -> List[str]:
+        """
+        Transcribe several in-memory waveforms in one pass
+        
+        Whisper batches the inputs through the HF pipeline. IndicConformer's
+        remote forward only accepts a single waveform, so items are run back
+        to back instead.
+        
+        Args:
+            audios: List of mono numpy waveforms
+            sampling_rate: Sampling rate shared by all waveforms
+            language_code: Language code (e.g., 'hi', 'ta', 'te')
+            decoding_type: Decoding method ('ctc' or 'rnnt')
+            batch_size: Number of waveforms per Whisper forward
+            chunk_length_s: Audio longer than this is transcribed in chunks,
+                as in transcribe
+            
+        Returns:
+            List of transcriptions, in input order
+        """
+        sr = sampling_rate or self.sampling_rate
+        if sr != self.sampling_rate:
+            audios = [self._resample(audio, sr) for audio in audios]
+        
+        logger.debug("Transcribing %d audio(s) with language: %s", len(audios), language_code)
+        
+        try:
+            if self.is_whisper:
+                outputs = self.model(
+                    [{"raw": audio, "sampling_rate": self.sampling_rate} for audio in audios],
+                    batch_size=batch_size,
+                    chunk_length_s=chunk_length_s
+                )
+                transcriptions = [output['text'] for output in outputs]
+            else:
+                transcriptions = [
+                    self._conformer_transcribe(audio, language_code, decoding_type, chunk_length_s)
+                    for audio in audios
+                ]
+            
+            logger.debug("Batch transcription complete")
+            return transcriptions
+            
+        except Exception as e:
+            raise RuntimeError(f"Batch transcription failed: {str(e)}")
+    
+    def _iter_loaded(
+        self,
+        audio_paths: list,
+        prefetch: int = 4,
+        decode_workers: int = 0
+    ):
+        """
+        Yield preprocessed audio for each path, in order, decoding ahead
+        
+        Args:
+            audio_paths: List of paths to audio files
+            prefetch: Maximum number of decoded files waiting for the model
+            decode_workers: Worker processes for decoding (0 decodes on threads)
+            
+        Yields:
+            Preprocessed mono waveform for each file
+        """
+        if decode_workers > 0:
+            # Spawned workers only decode (no torch, so no CUDA context);
+            # resampling and preprocessing stay in this process on the device
+            ctx = multiprocessing.get_context("spawn")
+            with ctx.Pool(decode_workers) as pool:
+                for path, decoded in zip(audio_paths, pool.imap(decode_audio, audio_paths)):
+                    if decoded is None:
+                        # Codec soundfile cannot read; let torchaudio try
+                        yield self.load_audio(path)[0]
+                    else:
+                        yield self.preprocess_audio(*decoded)
+            return
+        
+        workers = max(1, min(prefetch, os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            paths = iter(audio_paths)
+            for path in itertools.islice(paths, prefetch):
+                pending.append(pool.submit(self.load_audio, path))
+            
+            while pending:
+                audio, _ = pending.popleft().result()
+                # Keep the decode queue full while the model works
+                for path in itertools.islice(paths, 1):
+                    pending.append(pool.submit(self.load_audio, path))
+                yield audio
+    
     def transcribe_batch(
         self,
         audio_paths: list,
-        chunk_length_s: int = 30
+        chunk_length_s: int = 30,
+        language_code: str = "hi",
+        prefetch: int = 4,
+        decode_workers: int = 0,
+        batch_size: int = 8
     ) -> list:
         """
         Transcribe multiple audio files
         
+        Files are decoded and preprocessed on a thread pool (or decoded in
+        worker processes), at most `prefetch` ahead of the model, so decoding
+        of later files overlaps with ASR of earlier ones. Whisper transcribes
+        batch_size files per forward.
+        
         Args:
             audio_paths: List of paths to audio files
             chunk_length_s: Length of chunks for processing
+            language_code: Language code (e.g., 'hi', 'ta', 'te')
+            prefetch: Maximum number of decoded files waiting for the model
+            decode_workers: Worker processes for decoding (0 decodes on threads)
+            batch_size: Files per padded Whisper forward (IndicConformer's
+                remote-code forward takes one waveform, so it runs per file)
             
         Returns:
             List of transcriptions
         """
-        transcriptions = []
+        return list(self.transcribe_iter(
+            audio_paths,
+            chunk_length_s=chunk_length_s,
+            language_code=language_code,
+            prefetch=prefetch,
+            decode_workers=decode_workers,
+            batch_size=batch_size
+        ))
+    
+    def transcribe_iter(
+        self,
+        audio_paths: list,
+        chunk_length_s: int = 30,
+        language_code: str = "hi",
+        prefetch: int = 4,
+        decode_workers: int = 0,
+        batch_size: int = 8
+    ):
+        """
+        Transcribe multiple audio files, yielding each transcript when ready
         
-        for i, path in enumerate(audio_paths, 1):
-            print(f"\n📝 Processing file {i}/{len(audio_paths)}: {path}")
-            transcription = self.transcribe(path, chunk_length_s=chunk_length_s)
-            transcriptions.append(transcription)
+        Lets a consumer (e.g. NMT) start on early files while later ones are
+        still in ASR. Whisper files are yielded a batch at a time.
+        
+        Args:
+            audio_paths: List of paths to audio files
+            chunk_length_s: Length of chunks for processing
+            language_code: Language code (e.g., 'hi', 'ta', 'te')
+            prefetch: Maximum number of decoded files waiting for the model
+            decode_workers: Worker processes for decoding (0 decodes on threads)
+            batch_size: Files per padded Whisper forward
+            
+        Yields:
+            Transcription of each file, in input order
+        """
+        loaded = self._iter_loaded(audio_paths, prefetch, decode_workers)
+        
+        if self.is_whisper:
+            while True:
+                audios = list(itertools.islice(loaded, batch_size))
+                if not audios:
+                    return
+                yield from self.transcribe_many(
+                    audios,
+                    language_code=language_code,
+                    batch_size=batch_size,
+                    chunk_length_s=chunk_length_s
+                )
         
-        return transcriptions
+        for audio in loaded:
+            yield self.transcribe(audio, language_code=language_code, chunk_length_s=chunk_length_s)
     
     def __repr__(self):
         return f"IndicASR(model={self.model_name}, device={self.device})"
@@ -0,0 +1,29 @@
+"""
+Audio Decoding Helpers
+Torch-free audio decoding for worker processes
+"""
+
+import soundfile as sf
+import numpy as np
+from typing import Optional, Tuple
+
+
+def decode_audio(audio_path: str) -> Optional[Tuple[np.ndarray, int]]:
+    """
+    Decode an audio file to a mono float32 waveform
+
+    Only soundfile and numpy are used, so spawned workers never import
+    torch or touch CUDA.
+
+    Args:
+        audio_path: Path to audio file
+
+    Returns:
+        Tuple of (audio_array, sampling_rate), or None if soundfile cannot
+        decode the file
+    """
+    try:
+        data, sr = sf.read(audio_path, dtype='float32', always_2d=True)
+    except Exception:
+        return None
+    return data.mean(axis=1), sr
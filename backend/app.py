@@ -13,6 +13,11 @@ from fastapi import FastAPI, File, UploadFile, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
+import asyncio
+import torch
+import torchaudio
+import soundfile as sf
+import io
 import tempfile
 import shutil
 from pathlib import Path
@@ -27,6 +32,7 @@ import logging
 sys.path.append(str(Path(__file__).parent.parent))
 
 from pipeline import IndicSpeechToEnglishPipeline, list_supported_languages
+from asr_module import configure_cpu_threads
 from config import SUPPORTED_LANGUAGES
 from gemini_service import GeminiRefiner
 
@@ -59,20 +65,100 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global pipeline cache
+DEVICE = 'cuda' if torch.cuda.is_available() else 'cpu'
+if DEVICE == 'cpu':
+    # Leave half the cores to the uvicorn workers
+    configure_cpu_threads()
+
+# Global pipeline cache; pipelines share models through the pipeline module's registry
 pipelines = {}
 
+# Serializes model forwards so concurrent requests only overlap decode and I/O
+GPU_SEM = asyncio.Semaphore(1)
+
+
+@app.on_event("startup")
+def load_shared_models():
+    """Build every language pipeline at startup, loading each distinct model once"""
+    for language_code in SUPPORTED_LANGUAGES:
+        get_pipeline(language_code)
+
+
 def get_pipeline(language_code: str):
-    """Get or create pipeline for a language"""
+    """Get or create a pipeline for a language backed by the shared models"""
     if language_code not in pipelines:
-        logger.info(f"Loading pipeline for language: {language_code}")
+        logger.info(f"Creating pipeline for language: {language_code}")
         pipelines[language_code] = IndicSpeechToEnglishPipeline(
             language_code=language_code,
-            device='cpu'  # Use CPU for compatibility
+            device=DEVICE
         )
     return pipelines[language_code]
 
 
+def _copy_upload(upload: UploadFile) -> str:
+    """Write an uploaded file to a named temporary file and return its path"""
+    file_extension = Path(upload.filename).suffix or '.wav'
+    # delete=False so the file can be reopened by name on Windows; callers remove it
+    with tempfile.NamedTemporaryFile(suffix=file_extension, delete=False) as buffer:
+        shutil.copyfileobj(upload.file, buffer)
+    return buffer.name
+
+
+def _decode_upload(data: bytes):
+    """Decode uploaded audio bytes to a (waveform, sampling_rate) pair without a temp file"""
+    try:
+        return sf.read(io.BytesIO(data), dtype='float32', always_2d=False)
+    except Exception as e:
+        # libsndfile can't read webm or m4a/AAC; torchaudio decodes them via ffmpeg
+        logger.debug(f"soundfile decode failed, falling back to torchaudio: {str(e)}")
+        wav, sampling_rate = torchaudio.load(io.BytesIO(data))
+        return wav.mean(dim=0).numpy(), sampling_rate
+
+
+def refine_translation(english_text: str):
+    """Refine a translation with Gemini, returning None if unavailable or failed"""
+    if not gemini_refiner:
+        return None
+    try:
+        logger.info("Refining translation with Gemini...")
+        refined_prompt = gemini_refiner.refine_to_prototype_prompt(english_text)
+        logger.info("Gemini refinement successful!")
+        return refined_prompt
+    except Exception as e:
+        logger.warning(f"Gemini refinement failed: {str(e)}")
+        return None
+
+
+async def refine_translations(english_texts: list):
+    """Refine several translations concurrently, with None for each unavailable or failed one"""
+    if not gemini_refiner or not english_texts:
+        return [None] * len(english_texts)
+    logger.info(f"Refining {len(english_texts)} translations with Gemini...")
+    refined = await gemini_refiner.refine_batch(english_texts, return_exceptions=True)
+    for prompt in refined:
+        if isinstance(prompt, Exception):
+            logger.warning(f"Gemini refinement failed: {str(prompt)}")
+    return [None if isinstance(prompt, Exception) else prompt for prompt in refined]
+
+
+def build_response(result: dict, language: str, filename: str, refined_prompt):
+    """Build the API response for a single pipeline result"""
+    return {
+        "success": True,
+        "language": {
+            "code": language,
+            "name": result["language"]["name"],
+            "script": result["language"]["script"]
+        },
+        "transcription": result["indic_text"],
+        "translation": result["english_text"],
+        "refined_prompt": refined_prompt,  # Add refined prompt
+        "processing_time": result["processing_time"],
+        "timestamp": result["timestamp"],
+        "filename": filename
+    }
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -138,57 +224,32 @@ async def translate_audio(
             detail=f"Unsupported language: {language}. Supported: {list(SUPPORTED_LANGUAGES.keys())}"
         )
     
-    # Create temporary file for audio
-    temp_dir = tempfile.mkdtemp()
-    temp_audio_path = None
-    
     try:
-        # Save uploaded file
-        file_extension = Path(audio.filename).suffix or '.wav'
-        temp_audio_path = os.path.join(temp_dir, f"audio{file_extension}")
-        
-        with open(temp_audio_path, "wb") as buffer:
-            shutil.copyfileobj(audio.file, buffer)
+        # Decode the upload straight from memory, no temporary file
+        data = await audio.read()
+        audio_array, sampling_rate = await asyncio.to_thread(_decode_upload, data)
         
         logger.info(f"Processing audio file: {audio.filename} ({language})")
         
         # Get or create pipeline
         pipeline = get_pipeline(language)
         
-        # Process audio
-        result = pipeline.process(
-            audio_path=temp_audio_path,
-            output_dir=None,  # Don't save to disk
-            save_intermediate=False,
-            verbose=False
-        )
+        # Process audio off the event loop, one model forward at a time
+        async with GPU_SEM:
+            result = await asyncio.to_thread(
+                pipeline.process,
+                audio_array=audio_array,
+                sampling_rate=sampling_rate,
+                output_dir=None,  # Don't save to disk
+                save_intermediate=False,
+                verbose=False
+            )
         
         # Refine translation with Gemini
-        refined_prompt = None
-        if gemini_refiner:
-            try:
-                logger.info("Refining translation with Gemini...")
-                refined_prompt = gemini_refiner.refine_to_prototype_prompt(result["english_text"])
-                logger.info("Gemini refinement successful!")
-            except Exception as e:
-                logger.warning(f"Gemini refinement failed: {str(e)}")
-                refined_prompt = None
+        refined_prompt = await asyncio.to_thread(refine_translation, result["english_text"])
         
         # Prepare response
-        response = {
-            "success": True,
-            "language": {
-                "code": language,
-                "name": result["language"]["name"],
-                "script": result["language"]["script"]
-            },
-            "transcription": result["indic_text"],
-            "translation": result["english_text"],
-            "refined_prompt": refined_prompt,  # Add refined prompt
-            "processing_time": result["processing_time"],
-            "timestamp": result["timestamp"],
-            "filename": audio.filename
-        }
+        response = build_response(result, language, audio.filename, refined_prompt)
         
         logger.info(f"Successfully processed: {audio.filename}")
         return JSONResponse(content=response)
@@ -199,13 +260,6 @@ async def translate_audio(
             status_code=500,
             detail=f"Error processing audio: {str(e)}"
         )
-    
-    finally:
-        # Cleanup temporary files
-        if temp_audio_path and os.path.exists(temp_audio_path):
-            os.remove(temp_audio_path)
-        if os.path.exists(temp_dir):
-            os.rmdir(temp_dir)
 
 
 @app.post("/translate-batch")
@@ -230,18 +284,49 @@ async def translate_batch(
             detail=f"Unsupported language: {language}"
         )
     
+    temp_paths = []
     results = []
     
-    for audio_file in files:
-        try:
-            result = await translate_audio(audio_file, language)
-            results.append(result)
-        except Exception as e:
-            results.append({
-                "success": False,
-                "filename": audio_file.filename,
-                "error": str(e)
-            })
+    try:
+        # Save all uploads so the pipeline can process them in one batch
+        for audio_file in files:
+            temp_paths.append(await asyncio.to_thread(_copy_upload, audio_file))
+        
+        logger.info(f"Processing batch of {len(files)} audio files ({language})")
+        
+        pipeline = get_pipeline(language)
+        async with GPU_SEM:
+            batch_results = await asyncio.to_thread(
+                pipeline.process_batch, temp_paths, output_dir=None
+            )
+        
+        # Refine every successful translation concurrently rather than one by one
+        refined_prompts = iter(await refine_translations([
+            result["english_text"] for result in batch_results if "error" not in result
+        ]))
+        
+        for audio_file, result in zip(files, batch_results):
+            if "error" in result:
+                results.append({
+                    "success": False,
+                    "filename": audio_file.filename,
+                    "error": result["error"]
+                })
+            else:
+                results.append(build_response(result, language, audio_file.filename, next(refined_prompts)))
+    
+    except Exception as e:
+        logger.error(f"Error processing audio batch: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error processing audio batch: {str(e)}"
+        )
+    
+    finally:
+        # Cleanup temporary files
+        for temp_audio_path in temp_paths:
+            if os.path.exists(temp_audio_path):
+                os.remove(temp_audio_path)
     
     return {
         "total": len(files),
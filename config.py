@@ -8,12 +8,26 @@ ASR_MODEL_CONFIG = {
     "sampling_rate": 16000,
     "chunk_length_s": 30,
     "batch_size": 8,
+    "int8_cpu": True,  # Dynamic int8 quantization of Linear/LSTM layers on CPU
+    "vad": True,  # Whisper only: split single files at pauses and transcribe the segments as a batch
+    "decode_workers": 0,  # Processes decoding audio in batch mode (0: thread pool)
+    "cpu_file_workers": 2,  # Files processed concurrently on CPU with IndicConformer,
+                            # splitting torch.get_num_threads() between them
 }
 
 NMT_MODEL_CONFIG = {
     "model_name": "facebook/nllb-200-1.3B",  # NLLB-1.3B - Better quality than 600M
-    "batch_size": 4,
+    "token_budget": 4096,  # Padded tokens x beams per batch (length-bucketed)
     "max_length": 512,  # Increased from 256 for longer sentences
+    "num_beams": 4,  # Beam width; 1 (greedy) is fastest, 4 gives better translations
+    "backend": "torch",  # "torch", "onnx" (ONNX Runtime via optimum) or "ctranslate2"
+    "ct2_model_dir": "nllb-ct2",  # Output of ct2-transformers-converter --quantization int8
+    "onnx_model_dir": "nllb-onnx",  # ONNX export, written on first use of the onnx backend
+    "quantization": None,  # None or "int8" (bitsandbytes, torch backend only)
+    "compile": False,  # torch.compile the NLLB forward (torch backend only); on CUDA decoder
+                       # steps use a static KV cache and replay as CUDA graphs
+    "int8_cpu": True,  # Dynamic int8 quantization of Linear layers on CPU (torch backend)
+    "cache_size": 50000,  # Sentence translations memoized per (languages, text); 0 disables
 }
 
 # Supported Indic languages mapping
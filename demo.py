@@ -5,11 +5,16 @@ This script provides a command-line interface for easy testing.
 """
 
 import argparse
+import logging
+import os
 import sys
-from pathlib import Path
 
 
 def main():
+    # Block-buffer stdout; per-line flushing is wasted I/O when output is piped
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False)
+    
     parser = argparse.ArgumentParser(
         description='Indic Speech-to-English Translation Pipeline',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -68,6 +73,20 @@ Supported Languages:
         help='Don\'t save intermediate ASR output'
     )
     
+    parser.add_argument(
+        '--decode-workers',
+        type=int,
+        default=None,
+        help='Processes for decoding audio in batch mode (default: from config)'
+    )
+    
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=None,
+        help='Inputs per model forward in batch mode (default: from config)'
+    )
+    
     parser.add_argument(
         '--quiet', '-q',
         action='store_true',
@@ -76,7 +95,18 @@ Supported Languages:
     
     args = parser.parse_args()
     
-    # Import here to avoid slow imports when just showing help
+    # Validate audio files (language is validated by argparse choices)
+    audio_files = []
+    for audio_path in args.audio:
+        if not os.path.exists(audio_path):
+            print(f"❌ Error: Audio file not found: {audio_path}")
+            sys.exit(1)
+        audio_files.append(audio_path)
+    
+    # Pipeline progress is logged; print it plainly to stdout
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
+    # Import only after validation so help and bad arguments never load torch
     try:
         from pipeline import IndicSpeechToEnglishPipeline
     except ImportError as e:
@@ -85,15 +115,6 @@ Supported Languages:
         print("   pip install -r requirements.txt")
         sys.exit(1)
     
-    # Validate audio files
-    audio_files = []
-    for audio_path in args.audio:
-        path = Path(audio_path)
-        if not path.exists():
-            print(f"❌ Error: Audio file not found: {audio_path}")
-            sys.exit(1)
-        audio_files.append(str(path))
-    
     if not args.quiet:
         print("\n" + "=" * 70)
         print("🎯 Indic Speech-to-English Translation")
@@ -107,7 +128,8 @@ Supported Languages:
         # Initialize pipeline
         pipeline = IndicSpeechToEnglishPipeline(
             language_code=args.lang,
-            device=args.device
+            device=args.device,
+            verbose=not args.quiet
         )
         
         # Process files
@@ -136,7 +158,9 @@ Supported Languages:
             # Batch processing
             results = pipeline.process_batch(
                 audio_paths=audio_files,
-                output_dir=args.output
+                output_dir=args.output,
+                decode_workers=args.decode_workers,
+                batch_size=args.batch_size
             )
             
             if not args.quiet:
@@ -146,10 +170,10 @@ Supported Languages:
                 
                 for i, result in enumerate(results, 1):
                     if 'error' in result:
-                        print(f"\n[{i}] ❌ {Path(result['audio_path']).name}")
+                        print(f"\n[{i}] ❌ {os.path.basename(result['audio_path'])}")
                         print(f"    Error: {result['error']}")
                     else:
-                        print(f"\n[{i}] ✅ {Path(result['audio_path']).name}")
+                        print(f"\n[{i}] ✅ {os.path.basename(result['audio_path'])}")
                         print(f"    Time: {result['processing_time']['total']}s")
                         print(f"    Translation: {result['english_text'][:100]}...")
         
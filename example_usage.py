@@ -4,7 +4,9 @@ Example Usage of Indic Speech-to-English Translation Pipeline
 This script demonstrates how to use the pipeline for various scenarios.
 """
 
+import logging
 import os
+import sys
 from pathlib import Path
 from pipeline import IndicSpeechToEnglishPipeline, list_supported_languages
 
@@ -187,6 +189,9 @@ def example_lazy_loading():
 
 def main():
     """Run all examples"""
+    # Pipeline progress is logged; print it plainly to stdout
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
     print("\n" + "=" * 70)
     print("🎯 Indic Speech-to-English Translation Pipeline Examples")
     print("=" * 70)
@@ -3,36 +3,12 @@ Gemini API Service
 Refines translated text into structured prototype prompts
 """
 
+import asyncio
 import google.generativeai as genai
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional, Union
 
-class GeminiRefiner:
-    """
-    Service to refine translated text using Gemini API
-    """
-    
-    def __init__(self, api_key: str):
-        """
-        Initialize Gemini API
-        
-        Args:
-            api_key: Google Gemini API key
-        """
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash')
-        print("Gemini API initialized successfully!")
-    
-    def refine_to_prototype_prompt(self, text: str) -> str:
-        """
-        Refine translated text into a structured prototype prompt
-        
-        Args:
-            text: The translated English text
-            
-        Returns:
-            Refined prototype prompt
-        """
-        prompt_template = f"""You are an expert at transforming rough, unstructured ideas into clear, actionable prompts for building interactive prototypes and demos. Your goal is to help people rapidly visualize and test their concepts.
+# Refinement prompt, filled with str.format(text=...)
+_PROMPT_TEMPLATE = """You are an expert at transforming rough, unstructured ideas into clear, actionable prompts for building interactive prototypes and demos. Your goal is to help people rapidly visualize and test their concepts.
 
 Given this free-form idea: "{text}"
 
@@ -101,13 +77,130 @@ Create a [TYPE] prototype for [CONCEPT NAME].
 
 Begin your response directly with "Create a [TYPE] prototype..." without any preamble or explanation of your process.
 """
+
+
+class GeminiRefiner:
+    """
+    Service to refine translated text using Gemini API
+    """
+    
+    def __init__(self, api_key: str, verbose: bool = False):
+        """
+        Initialize Gemini API
+        
+        Args:
+            api_key: Google Gemini API key
+            verbose: Print request progress messages
+        """
+        genai.configure(api_key=api_key)
+        self.model = genai.GenerativeModel('gemini-2.0-flash')
+        self.verbose = verbose
+        if verbose:
+            print("Gemini API initialized successfully!")
+    
+    def _build_prompt(self, text: str) -> str:
+        """
+        Build the refinement prompt for a translated text
+        
+        Args:
+            text: The translated English text
+            
+        Returns:
+            Full prompt sent to Gemini
+        """
+        return _PROMPT_TEMPLATE.format(text=text)
+    
+    def refine_to_prototype_prompt(
+        self,
+        text: Union[str, Iterable[str]],
+        stream: bool = False
+    ) -> Union[str, Iterator[str]]:
+        """
+        Refine translated text into a structured prototype prompt
+        
+        Args:
+            text: The translated English text, or an iterable of text pieces
+                such as a TextIteratorStreamer passed to IndicTranslator.translate
+            stream: Yield the refined prompt in pieces as Gemini produces them
+            
+        Returns:
+            Refined prototype prompt, or an iterator over its pieces if streaming
+        """
+        if not isinstance(text, str):
+            # Gemini needs the whole prompt up front, so drain the translation
+            # stream as it is decoded and send once it ends
+            text = "".join(text)
+        
+        if stream:
+            return self._stream_refinement(self._build_prompt(text))
         
         try:
-            print("Sending to Gemini API for refinement...")
-            response = self.model.generate_content(prompt_template)
+            if self.verbose:
+                print("Sending to Gemini API for refinement...")
+            response = self.model.generate_content(self._build_prompt(text))
             refined_prompt = response.text
-            print("Gemini refinement complete!")
+            if self.verbose:
+                print("Gemini refinement complete!")
             return refined_prompt
         except Exception as e:
             print(f"Error calling Gemini API: {str(e)}")
             raise RuntimeError(f"Gemini API error: {str(e)}")
+    
+    def _stream_refinement(self, prompt: str) -> Iterator[str]:
+        """
+        Stream a Gemini response
+        
+        Args:
+            prompt: Full prompt sent to Gemini
+            
+        Yields:
+            Pieces of the refined prototype prompt
+        """
+        try:
+            if self.verbose:
+                print("Streaming refinement from Gemini API...")
+            for chunk in self.model.generate_content(prompt, stream=True):
+                yield chunk.text
+            if self.verbose:
+                print("Gemini refinement complete!")
+        except Exception as e:
+            print(f"Error calling Gemini API: {str(e)}")
+            raise RuntimeError(f"Gemini API error: {str(e)}")
+    
+    async def refine_batch(
+        self,
+        texts: List[str],
+        max_concurrency: int = 8,
+        return_exceptions: bool = False
+    ) -> List[str]:
+        """
+        Refine several translated texts with concurrent Gemini requests
+        
+        Args:
+            texts: The translated English texts
+            max_concurrency: Max requests in flight, to stay within API rate limits
+            return_exceptions: Return a RuntimeError in place of each failed
+                refinement instead of raising on the first failure
+            
+        Returns:
+            Refined prototype prompts, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def refine_one(text: str) -> str:
+            async with semaphore:
+                try:
+                    response = await self.model.generate_content_async(self._build_prompt(text))
+                    return response.text
+                except Exception as e:
+                    raise RuntimeError(f"Gemini API error: {str(e)}")
+        
+        if self.verbose:
+            print(f"Sending {len(texts)} texts to Gemini API for refinement...")
+        refined = await asyncio.gather(
+            *(refine_one(text) for text in texts),
+            return_exceptions=return_exceptions
+        )
+        if self.verbose:
+            print("Gemini refinement complete!")
+        return list(refined)
@@ -3,11 +3,68 @@ Neural Machine Translation (NMT) Module
 Translates Indic text to English using Facebook NLLB
 """
 
+import hashlib
+import logging
+import os
+import re
+import threading
+import weakref
+from collections import OrderedDict
 import torch
 from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 import warnings
-warnings.filterwarnings('ignore')
+from tqdm.auto import tqdm
+
+try:
+    from indicnlp.tokenize import sentence_tokenize
+except ImportError:
+    sentence_tokenize = None
+
+logger = logging.getLogger(__name__)
+
+# FLORES-200 language prefix -> ISO 639-1 code used by indic_nlp_library
+FLORES_TO_ISO = {
+    "hin": "hi", "tam": "ta", "tel": "te", "mal": "ml", "kan": "kn",
+    "mar": "mr", "guj": "gu", "ben": "bn", "ory": "or", "pan": "pa",
+}
+
+class _LoadedModel:
+    """Tokenizer and model loaded once, with the lock serializing every translator using them"""
+    
+    def __init__(self, tokenizer, model):
+        self.tokenizer = tokenizer
+        self.model = model
+        # The tokenizer's src_lang is mutable, so translate() calls must not interleave
+        self.lock = threading.RLock()
+
+
+# Loaded models keyed by their load settings, shared across instances; held
+# weakly, so weights are freed once no IndicTranslator uses them
+_MODEL_CACHE: "weakref.WeakValueDictionary[tuple, _LoadedModel]" = weakref.WeakValueDictionary()
+
+
+def clear_model_cache():
+    """Forget cached NMT weights, so the next IndicTranslator loads its own copy"""
+    _MODEL_CACHE.clear()
+
+
+def _from_pretrained(loader, model_name: str, **kwargs):
+    """
+    Load from the local HF cache without hub revalidation, downloading if missing
+    
+    Args:
+        loader: from_pretrained callable (e.g., AutoTokenizer.from_pretrained)
+        model_name: HuggingFace model identifier
+        **kwargs: Extra arguments for the loader
+        
+    Returns:
+        Loaded object
+    """
+    try:
+        return loader(model_name, local_files_only=True, **kwargs)
+    except OSError:
+        return loader(model_name, **kwargs)
 
 
 class IndicTranslator:
@@ -15,11 +72,24 @@ class IndicTranslator:
     Neural Machine Translation for Indic languages to English using NLLB
     """
     
+    # Danda, double danda, pipe, !, ?, newline, and '.' not followed by a digit
+    _SPLIT_RE = re.compile(r'(?:[।॥|!?\n]|\.(?!\d))+')
+    
     def __init__(
         self,
         model_name: str = "facebook/nllb-200-1.3B",
         device: Optional[str] = None,
-        max_length: int = 512
+        max_length: int = 512,
+        backend: str = "torch",
+        quantization: Optional[str] = None,
+        ct2_model_dir: str = "nllb-ct2",
+        token_budget: int = 4096,
+        compile_model: bool = False,
+        cache_size: int = 50000,
+        verbose: bool = False,
+        dtype: Optional[torch.dtype] = None,
+        int8_cpu: bool = False,
+        onnx_model_dir: str = "nllb-onnx"
     ):
         """
         Initialize the NMT model
@@ -28,46 +98,394 @@ class IndicTranslator:
             model_name: HuggingFace model identifier
             device: Device to run inference on ('cuda', 'cpu', or None for auto)
             max_length: Maximum sequence length for translation
+            backend: 'torch' for eager PyTorch, 'onnx' for ONNX Runtime via optimum,
+                'ctranslate2' for a CTranslate2 int8 conversion of the model
+            quantization: 'int8' to load weights in 8-bit via bitsandbytes (torch backend)
+            ct2_model_dir: Directory of the converted CTranslate2 model, created with
+                ct2-transformers-converter --model <model_name> --output_dir <dir>
+                --quantization int8
+            token_budget: Max padded tokens times beam width per translation batch
+            compile_model: torch.compile the model forward (torch backend)
+            cache_size: Max translations kept in the LRU cache (0 disables it)
+            verbose: Show a progress bar while translating many batches
+            dtype: Weight/compute dtype for the torch backend (default: float16
+                on CUDA, float32 on CPU); torch.bfloat16 suits Ampere+ GPUs
+                and AVX-512-BF16 CPUs
+            int8_cpu: Dynamically quantize Linear layers to int8 when on CPU
+                (torch backend, float32, no bitsandbytes quantization)
+            onnx_model_dir: Directory the ONNX export is saved to on first use
+                and loaded from afterwards (onnx backend)
         """
+        if backend not in ("torch", "onnx", "ctranslate2"):
+            raise ValueError(f"Unsupported NMT backend: {backend}")
+        if quantization not in (None, "int8"):
+            raise ValueError(f"Unsupported NMT quantization: {quantization}")
+        
         self.device = device or ('cuda' if torch.cuda.is_available() else 'cpu')
         self.max_length = max_length
         self.model_name = model_name
+        self.backend = backend
+        self.quantization = quantization
+        self.token_budget = token_budget
+        self.verbose = verbose
+        # Memoized target language code -> token id used as forced BOS
+        self._lang_token_ids = {}
+        # LRU of finished translations, so repeated phrases skip generation
+        self.cache_size = cache_size
+        self._cache: OrderedDict = OrderedDict()
+        # Half precision on GPU roughly doubles matmul throughput and halves VRAM
+        self.dtype = dtype or (torch.float16 if self.device == 'cuda' else torch.float32)
+        quantize_cpu = (
+            int8_cpu and self.device == 'cpu' and backend == "torch"
+            and quantization is None and self.dtype == torch.float32
+        )
+        
+        logger.debug("Loading NMT model: %s on %s", model_name, self.device)
         
-        print(f"Loading NMT model: {model_name}")
-        print(f"Using device: {self.device}")
+        cache_key = (
+            model_name, self.device, self.dtype, backend, quantization,
+            ct2_model_dir, compile_model, quantize_cpu, onnx_model_dir
+        )
+        # Holding the shared entry keeps it in the weak cache while this instance lives
+        self._loaded = _MODEL_CACHE.get(cache_key)
+        if self._loaded is not None:
+            logger.debug("Reusing cached NMT model")
+            self.tokenizer = self._loaded.tokenizer
+            self.model = self._loaded.model
+            self._lock = self._loaded.lock
+            return
         
         try:
-            print("Step 1: Loading tokenizer...")
             # Load NLLB tokenizer (no trust_remote_code needed)
-            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-            print("Step 2: Tokenizer loaded successfully!")
-            
-            print("Step 3: Loading model...")
-            self.model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
-            print("Step 4: Model loaded successfully!")
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                # Rust (tokenizers) backend; batch encoding runs outside the GIL
+                self.tokenizer = _from_pretrained(
+                    AutoTokenizer.from_pretrained, model_name, use_fast=True
+                )
+            if backend == "onnx":
+                self.model = self._load_onnx_model(model_name, onnx_model_dir)
+            elif backend == "ctranslate2":
+                self.model = self._load_ct2_model(ct2_model_dir)
+            else:
+                load_kwargs = {
+                    "torch_dtype": self.dtype,
+                    "low_cpu_mem_usage": True,
+                    "device_map": {"": self.device},
+                    # Fused scaled-dot-product attention (FlashAttention / mem-efficient kernels)
+                    "attn_implementation": "sdpa"
+                }
+                if quantization == "int8":
+                    from transformers import BitsAndBytesConfig
+                    load_kwargs["quantization_config"] = BitsAndBytesConfig(load_in_8bit=True)
+                
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore')
+                    try:
+                        self.model = _from_pretrained(
+                            AutoModelForSeq2SeqLM.from_pretrained, model_name, **load_kwargs
+                        )
+                    except (ValueError, TypeError):
+                        # Older transformers releases don't accept attn_implementation="sdpa"
+                        load_kwargs.pop("attn_implementation")
+                        self.model = _from_pretrained(
+                            AutoModelForSeq2SeqLM.from_pretrained, model_name, **load_kwargs
+                        )
+                self.model.eval()
+                
+                if quantize_cpu:
+                    # int8 GEMMs for the Linear layers, which hold nearly all of
+                    # NLLB's weights; halves weight traffic with VNNI/AMX kernels
+                    self.model = torch.ao.quantization.quantize_dynamic(
+                        self.model,
+                        {torch.nn.Linear},
+                        dtype=torch.qint8
+                    )
+                
+                if compile_model:
+                    # generate() calls forward() once per decoder step; compiling it
+                    # fuses kernels and enables CUDA graphs in reduce-overhead mode
+                    if self.device == 'cuda' and (
+                        getattr(self.model, "_supports_static_cache", False)
+                        or getattr(self.model, "_can_compile_fullgraph", False)
+                    ):
+                        # A preallocated KV cache keeps decoder-step shapes fixed, so
+                        # each captured graph is replayed instead of re-recorded per step
+                        self.model.generation_config.cache_implementation = "static"
+                    self.model.forward = torch.compile(
+                        self.model.forward,
+                        mode="reduce-overhead",
+                        fullgraph=False
+                    )
             
-            print("Step 5: Moving to device...")
-            self.model.to(self.device)
-            self.model.eval()
+            if compile_model and backend == "torch":
+                self._warmup()
             
-            print("NMT model loaded successfully!")
+            self._loaded = _LoadedModel(self.tokenizer, self.model)
+            self._lock = self._loaded.lock
+            _MODEL_CACHE[cache_key] = self._loaded
+            logger.debug("NMT model loaded: %s", model_name)
             
         except Exception as e:
-            print(f"ERROR: Failed to load NMT model")
-            print(f"Error type: {type(e).__name__}")
-            print(f"Error message: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Failed to load NMT model %s", model_name)
             raise RuntimeError(f"Failed to load NMT model: {str(e)}")
     
+    def _warmup(self):
+        """
+        Run one throwaway generate() so torch.compile traces and captures
+        graphs at load time instead of on the first real request
+        """
+        logger.debug("Warming up compiled NMT model")
+        batch_ids = [self.tokenizer(
+            "This sentence only warms up the compiled translation model before use."
+        )["input_ids"]]
+        forced_bos_token_id = self.tokenizer.convert_tokens_to_ids("eng_Latn")
+        self._translate_batch_hf(batch_ids, forced_bos_token_id, 4, 1, 1.0)
+    
+    def _load_onnx_model(self, model_name: str, model_dir: str):
+        """
+        Load the ONNX export of the model in ONNX Runtime, exporting it once
+        
+        The first load exports the model and saves it to model_dir; later
+        loads read model_dir directly, skipping the export.
+        
+        Args:
+            model_name: HuggingFace model identifier
+            model_dir: Directory holding (or receiving) the ONNX export
+            
+        Returns:
+            ORTModelForSeq2SeqLM exposing the usual generate() API
+        """
+        try:
+            from optimum.onnxruntime import ORTModelForSeq2SeqLM
+        except ImportError:
+            raise RuntimeError(
+                "ONNX backend requires optimum[onnxruntime]. "
+                "Install with: pip install optimum[onnxruntime-gpu]"
+            )
+        
+        if self.device == 'cuda':
+            import onnxruntime as ort
+            available = ort.get_available_providers()
+            provider = next(
+                (p for p in ("TensorrtExecutionProvider", "CUDAExecutionProvider") if p in available),
+                "CPUExecutionProvider"
+            )
+        else:
+            provider = "CPUExecutionProvider"
+        
+        if os.path.isfile(os.path.join(model_dir, "config.json")):
+            logger.debug("Loading ONNX export %s (provider: %s)", model_dir, provider)
+            return ORTModelForSeq2SeqLM.from_pretrained(model_dir, provider=provider)
+        
+        logger.debug("Exporting NMT model to ONNX in %s (provider: %s)", model_dir, provider)
+        model = ORTModelForSeq2SeqLM.from_pretrained(
+            model_name,
+            export=True,
+            provider=provider
+        )
+        model.save_pretrained(model_dir)
+        return model
+    
+    def _load_ct2_model(self, model_dir: str):
+        """
+        Load a CTranslate2 conversion of the model
+        
+        Args:
+            model_dir: Directory produced by ct2-transformers-converter
+            
+        Returns:
+            ctranslate2.Translator
+        """
+        try:
+            import ctranslate2
+        except ImportError:
+            raise RuntimeError(
+                "CTranslate2 backend requires ctranslate2. "
+                "Install with: pip install ctranslate2"
+            )
+        
+        compute_type = "int8_float16" if self.device == 'cuda' else "int8"
+        logger.debug("Loading %s (compute type: %s)", model_dir, compute_type)
+        return ctranslate2.Translator(
+            model_dir,
+            device=self.device,
+            compute_type=compute_type,
+            inter_threads=2,
+            intra_threads=4
+        )
+    
+    def _translate_batch_ct2(
+        self,
+        batch_ids: List[List[int]],
+        target_lang: str,
+        num_beams: int,
+        num_return_sequences: int
+    ) -> List[str]:
+        """
+        Translate one batch with the CTranslate2 backend
+        
+        Args:
+            batch_ids: Token ids of each input, encoded with the source language
+            target_lang: Target language code
+            num_beams: Beam size
+            num_return_sequences: Number of translations to return per input
+            
+        Returns:
+            Translated texts, num_return_sequences per input
+        """
+        source_tokens = [self.tokenizer.convert_ids_to_tokens(ids) for ids in batch_ids]
+        results = self.model.translate_batch(
+            source_tokens,
+            target_prefix=[[target_lang]] * len(batch_ids),
+            beam_size=num_beams,
+            num_hypotheses=num_return_sequences,
+            max_decoding_length=self.max_length,
+            no_repeat_ngram_size=3
+        )
+        # Drop the forced target language token before decoding
+        return [
+            self.tokenizer.decode(
+                self.tokenizer.convert_tokens_to_ids(hypothesis[1:]),
+                skip_special_tokens=True
+            )
+            for result in results
+            for hypothesis in result.hypotheses
+        ]
+    
+    def _translate_batch_hf(
+        self,
+        batch_ids: List[List[int]],
+        forced_bos_token_id: int,
+        num_beams: int,
+        num_return_sequences: int,
+        temperature: float,
+        streamer=None
+    ) -> List[str]:
+        """
+        Translate one batch with the HuggingFace / ONNX Runtime generate() API
+        
+        Args:
+            batch_ids: Token ids of each input, encoded with the source language
+            forced_bos_token_id: Token id of the target language code
+            num_beams: Number of beams for beam search
+            num_return_sequences: Number of translations to return per input
+            temperature: Sampling temperature
+            streamer: Optional transformers streamer fed tokens as they are decoded
+            
+        Returns:
+            Translated texts, num_return_sequences per input
+        """
+        # Pad the pre-tokenized inputs; multiples of 8 suit FP16 tensor cores
+        inputs = self.tokenizer.pad(
+            {"input_ids": batch_ids},
+            padding=True,
+            pad_to_multiple_of=8,
+            return_tensors="pt"
+        )
+        
+        # Move to device
+        inputs = inputs.to(self.device, non_blocking=True)
+        
+        # Short inputs (typical CLI snippets) gain nothing from n-gram blocking,
+        # waiting on every beam or a long length cap, so decode them cheaply.
+        # Decided on the longest input, since the settings apply to the whole batch
+        short = max(map(len, batch_ids)) < 10
+        if short:
+            num_beams = min(num_beams, max(2, num_return_sequences))
+        
+        # Generate translation with improved parameters
+        # generate() runs the encoder once per batch and expands its output
+        # to batch*num_beams a single time before decoding, so the encoder
+        # is not re-run per beam or per step and needs no manual pre-expansion
+        with torch.inference_mode(), torch.autocast(
+            self.device, dtype=self.dtype, enabled=self.dtype != torch.float32
+        ):
+            generated_tokens = self.model.generate(
+                **inputs,
+                forced_bos_token_id=forced_bos_token_id,
+                num_beams=num_beams,
+                num_return_sequences=num_return_sequences,
+                max_length=min(32, self.max_length) if short else self.max_length,
+                min_length=1,
+                length_penalty=1.0,  # Balanced length penalty
+                early_stopping=not short,  # Stop when all beams finish
+                use_cache=True,  # Reuse past key/values across decoder steps
+                no_repeat_ngram_size=0 if short else 3,  # Prevent repetition
+                temperature=temperature,
+                do_sample=False,
+                streamer=streamer
+            )
+        
+        # Decode translations
+        return self.tokenizer.batch_decode(
+            generated_tokens,
+            skip_special_tokens=True
+        )
+    
+    def _length_batches(
+        self,
+        lengths: List[int],
+        num_beams: int,
+        max_batch_size: Optional[int] = None
+    ) -> List[List[int]]:
+        """
+        Group input indices into batches of similar length under a token budget
+        
+        Inputs are sorted by length so short sentences don't pad up to long
+        ones; a batch is closed once its padded size times the beam width
+        would exceed self.token_budget or it holds max_batch_size inputs.
+        
+        Args:
+            lengths: Token length of each input
+            num_beams: Beam width used for decoding
+            max_batch_size: Optional cap on inputs per batch
+            
+        Returns:
+            List of batches, each a list of input indices
+        """
+        order = sorted(range(len(lengths)), key=lengths.__getitem__)
+        batches = []
+        current = []
+        for idx in order:
+            # Sorted ascending, so this input sets the padded length of the batch
+            padded_tokens = (len(current) + 1) * lengths[idx] * num_beams
+            if current and (
+                padded_tokens > self.token_budget
+                or len(current) == max_batch_size
+            ):
+                batches.append(current)
+                current = []
+            current.append(idx)
+        if current:
+            batches.append(current)
+        return batches
+    
+    def _cache_put(self, key: tuple, translations: List[str]):
+        """
+        Store a translation in the LRU cache, evicting the oldest when full
+        
+        Args:
+            key: Generation settings followed by the source text digest
+            translations: Translations generated for that text
+        """
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = translations
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+    
     def translate(
         self,
         text: Union[str, List[str]],
         source_lang: str,
         target_lang: str = "eng_Latn",
-        num_beams: int = 5,
+        num_beams: int = 4,
         num_return_sequences: int = 1,
-        temperature: float = 1.0
+        temperature: float = 1.0,
+        verbose: Optional[bool] = None,
+        streamer=None,
+        batch_size: Optional[int] = None
     ) -> Union[str, List[str]]:
         """
         Translate Indic text to English
@@ -79,6 +497,14 @@ class IndicTranslator:
             num_beams: Number of beams for beam search
             num_return_sequences: Number of translations to return
             temperature: Sampling temperature
+            verbose: Show a progress bar (defaults to the instance setting)
+            streamer: Optional transformers TextStreamer / TextIteratorStreamer
+                (created with skip_prompt=True, skip_special_tokens=True) that
+                receives the translation as it is decoded, so downstream work
+                can start early; needs a single text, num_beams=1 and the
+                torch or onnx backend
+            batch_size: Max inputs per generate() call on top of the token
+                budget (None: token budget only)
             
         Returns:
             Translated text or list of texts
@@ -87,118 +513,217 @@ class IndicTranslator:
         single_input = isinstance(text, str)
         if single_input:
             text = [text]
+        if streamer is not None and (
+            len(text) != 1 or num_beams != 1 or self.backend == "ctranslate2"
+        ):
+            raise ValueError(
+                "Streaming needs a single text, num_beams=1 and the torch or onnx backend"
+            )
+        if verbose is None:
+            verbose = self.verbose
         
-        print(f"Translating {len(text)} text(s) from {source_lang} to {target_lang}...")
+        logger.debug("Translating %d text(s) from %s to %s", len(text), source_lang, target_lang)
         
-        try:
-            translations = []
-            
-            # Process in batches
-            batch_size = 4
-            for i in range(0, len(text), batch_size):
-                batch = text[i:i + batch_size]
+        # The tokenizer and translation cache are not safe to share between threads
+        with self._lock:
+            try:
+                # Set source language for NLLB tokenizer; reassigning rebuilds its
+                # special-token setup, so only do it when the language changes
+                if self.tokenizer.src_lang != source_lang:
+                    self.tokenizer.src_lang = source_lang
+                
+                if target_lang not in self._lang_token_ids:
+                    self._lang_token_ids[target_lang] = self.tokenizer.convert_tokens_to_ids(target_lang)
+                forced_bos_token_id = self._lang_token_ids[target_lang]
                 
-                # Set source language for NLLB tokenizer
-                self.tokenizer.src_lang = source_lang
+                # Translations per input; cache hits are filled in up front
+                outputs = [None] * len(text)
+                settings = (source_lang, target_lang, num_beams, num_return_sequences, temperature)
+                # Unique uncached text -> every input index it appears at
+                pending: Dict[str, List[int]] = {}
+                keys: Dict[str, tuple] = {}
+                for idx, t in enumerate(text):
+                    if t not in keys:
+                        # A fixed 16-byte digest keeps long sentences out of the cache
+                        keys[t] = settings + (hashlib.blake2b(t.encode(), digest_size=16).digest(),)
+                    key = keys[t]
+                    if key in self._cache:
+                        self._cache.move_to_end(key)
+                        outputs[idx] = self._cache[key]
+                        if streamer is not None:
+                            # Nothing is generated, so hand the cached text over whole
+                            streamer.on_finalized_text(outputs[idx][0], stream_end=True)
+                    else:
+                        pending.setdefault(t, []).append(idx)
+                pending_texts = list(pending)
                 
-                # Prepare input
-                inputs = self.tokenizer(
-                    batch,
-                    return_tensors="pt",
-                    padding=True,
+                # Tokenize everything once to get lengths for bucketing
+                all_ids = self.tokenizer(
+                    pending_texts,
                     truncation=True,
                     max_length=self.max_length
-                )
+                )["input_ids"] if pending_texts else []
+                batches = self._length_batches([len(ids) for ids in all_ids], num_beams, batch_size)
                 
-                # Move to device
-                inputs = {k: v.to(self.device) for k, v in inputs.items()}
+                # Process in batches
+                for batch_idx in tqdm(batches, desc="Translating", disable=not verbose or len(batches) < 2):
+                    batch_ids = [all_ids[idx] for idx in batch_idx]
+                    
+                    if self.backend == "ctranslate2":
+                        batch_translations = self._translate_batch_ct2(
+                            batch_ids, target_lang, num_beams, num_return_sequences
+                        )
+                    else:
+                        batch_translations = self._translate_batch_hf(
+                            batch_ids, forced_bos_token_id, num_beams, num_return_sequences,
+                            temperature, streamer
+                        )
+                    
+                    # Restore original order and remember the result
+                    for j, idx in enumerate(batch_idx):
+                        per_input = batch_translations[
+                            j * num_return_sequences:(j + 1) * num_return_sequences
+                        ]
+                        for out_idx in pending[pending_texts[idx]]:
+                            outputs[out_idx] = per_input
+                        self._cache_put(keys[pending_texts[idx]], per_input)
                 
-                # Generate translation with improved parameters
-                with torch.no_grad():
-                    generated_tokens = self.model.generate(
-                        **inputs,
-                        forced_bos_token_id=self.tokenizer.convert_tokens_to_ids(target_lang),
-                        num_beams=8,  # Increased from 5 for better quality
-                        num_return_sequences=num_return_sequences,
-                        max_length=self.max_length,
-                        min_length=1,
-                        length_penalty=1.0,  # Balanced length penalty
-                        early_stopping=True,  # Stop when all beams finish
-                        no_repeat_ngram_size=3,  # Prevent repetition
-                        temperature=temperature,
-                        do_sample=False
-                    )
+                translations = [t for per_input in outputs for t in per_input]
                 
-                # Decode translations
-                batch_translations = self.tokenizer.batch_decode(
-                    generated_tokens,
-                    skip_special_tokens=True
-                )
+                logger.debug("Translation complete")
                 
-                translations.extend(batch_translations)
+                # Return single string if input was single string
+                if single_input:
+                    return translations[0]
+                return translations
                 
-                if len(text) > batch_size:
-                    progress = min((i + batch_size) / len(text) * 100, 100)
-                    print(f"   Progress: {progress:.1f}%")
-            
-            print(f"Translation complete!")
-            
-            # Return single string if input was single string
-            if single_input:
-                return translations[0]
-            return translations
-            
-        except Exception as e:
-            raise RuntimeError(f"Translation failed: {str(e)}")
+            except Exception as e:
+                raise RuntimeError(f"Translation failed: {str(e)}")
     def translate_sentences(
         self,
         text: str,
         source_lang: str,
-        sentence_split: bool = True
+        sentence_split: bool = True,
+        num_beams: int = 4,
+        batch_size: Optional[int] = None
     ) -> str:
         """
         Translate text with sentence-level processing for better quality
         
+        All sentences are translated together in length-bucketed batches,
+        usually a single generate() call per file.
+        
         Args:
             text: Input text in Indic language
             source_lang: Source language code
             sentence_split: Whether to split into sentences
+            num_beams: Beam width (1 for greedy decoding, the fastest)
+            batch_size: Max sentences per generate() call (None: token budget only)
             
         Returns:
             Translated English text
         """
-        if not sentence_split or len(text.split()) < 20:
-            return self.translate(text, source_lang)
+        return self.translate_documents(
+            [text], source_lang, sentence_split, batch_size=batch_size, num_beams=num_beams
+        )[0]
+    
+    def translate_documents(
+        self,
+        texts: List[str],
+        source_lang: str,
+        sentence_split: bool = True,
+        batch_size: Optional[int] = None,
+        num_beams: int = 4
+    ) -> List[str]:
+        """
+        Translate several documents with a single batched translate call
         
-        # Simple sentence splitting (can be improved with language-specific tools)
-        sentences = self._split_sentences(text)
+        Long documents are split into sentences; all sentences are flattened
+        into one list so they share batches, then regrouped per document.
         
-        print(f"Translating {len(sentences)} sentences...")
+        Args:
+            texts: Input texts in Indic language
+            source_lang: Source language code
+            sentence_split: Whether to split long texts into sentences
+            batch_size: Max sentences per generate() call (None: token budget only)
+            num_beams: Beam width (1 for greedy decoding, the fastest)
+            
+        Returns:
+            Translated English text for each input, in input order
+        """
+        segments = []
+        counts = []
+        for text in texts:
+            if not text.strip():
+                # Empty transcripts (silence, failed decode) need no forward pass
+                counts.append(0)
+                continue
+            # Space count approximates word count without building a word list
+            if not sentence_split or text.count(' ') < 20:
+                parts = [text]
+            else:
+                # Simple sentence splitting (can be improved with language-specific tools)
+                parts = self._split_sentences(text, source_lang) or [text]
+            segments.extend(self._clip_words(part) for part in parts)
+            counts.append(len(parts))
         
-        # Translate each sentence
-        translations = self.translate(sentences, source_lang)
+        if not segments:
+            return [""] * len(texts)
         
-        # Combine translations
-        return " ".join(translations)
+        logger.debug("Translating %d sentences from %d text(s)", len(segments), len(texts))
+        
+        translations = self.translate(
+            segments, source_lang, num_beams=num_beams, batch_size=batch_size
+        )
+        
+        # Combine translations back per document
+        results = []
+        offset = 0
+        for count in counts:
+            results.append(" ".join(translations[offset:offset + count]))
+            offset += count
+        return results
     
-    def _split_sentences(self, text: str) -> List[str]:
+    def _clip_words(self, text: str) -> str:
         """
-        Simple sentence splitter (basic implementation)
+        Drop words beyond max_length before tokenization
+        
+        Every word is at least one token, so anything past max_length words
+        would be truncated by the tokenizer anyway.
+        
+        Args:
+            text: Input sentence
+            
+        Returns:
+            Sentence with at most max_length whitespace-separated words
+        """
+        if text.count(' ') < self.max_length:
+            return text
+        return " ".join(text.split()[:self.max_length])
+    
+    def _split_sentences(self, text: str, source_lang: Optional[str] = None) -> List[str]:
+        """
+        Split text into sentences
+        
+        Uses indic_nlp_library's sentence splitter when it is installed and
+        knows the language, otherwise splits on Indic and Latin punctuation.
         
         Args:
             text: Input text
+            source_lang: FLORES-200 source language code (e.g., 'hin_Deva')
             
         Returns:
             List of sentences
         """
-        # Basic splitting on common punctuation
-        import re
-        
-        # Split on sentence boundaries
-        sentences = re.split(r'[।॥|!?]+', text)
+        iso_lang = FLORES_TO_ISO.get((source_lang or "").split("_")[0])
+        if sentence_tokenize is not None and iso_lang:
+            sentences = sentence_tokenize.sentence_split(text, lang=iso_lang)
+        else:
+            # Split on sentence boundaries
+            sentences = self._SPLIT_RE.split(text)
         
         # Clean and filter empty sentences
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = [s for s in map(str.strip, sentences) if s]
         
         return sentences
     
@@ -206,27 +731,25 @@ class IndicTranslator:
         self,
         texts: List[str],
         source_lang: str,
-        batch_size: int = 4
+        batch_size: Optional[int] = None
     ) -> List[str]:
         """
         Translate multiple texts efficiently
         
+        All texts go through one translate call, which pads length-sorted
+        batches so every batch is a single generate() forward.
+        
         Args:
             texts: List of input texts
             source_lang: Source language code
-            batch_size: Batch size for processing
+            batch_size: Max texts per batch (None: token budget only)
             
         Returns:
             List of translations
         """
-        all_translations = []
-        
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            translations = self.translate(batch, source_lang)
-            all_translations.extend(translations)
-        
-        return all_translations
+        if not texts:
+            return []
+        return self.translate(list(texts), source_lang, batch_size=batch_size)
     
     def __repr__(self):
         return f"IndicTranslator(model={self.model_name}, device={self.device})"
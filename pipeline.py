@@ -3,13 +3,35 @@ Indic Speech-to-English Translation Pipeline
 Two-stage pipeline: ASR (Speech-to-Text) + NMT (Text-to-English)
 """
 
+import gc
+import itertools
 import os
 import json
+import logging
+import multiprocessing
 import time
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Optional, Dict, Union, List
+from typing import TYPE_CHECKING, Optional, Dict, Union, List, Tuple
 from datetime import datetime
 
+import numpy as np
+import torch
+from tqdm.auto import tqdm
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+from audio_io import decode_audio
 from asr_module import IndicASR
 from nmt_module import IndicTranslator
 from config import (
@@ -19,6 +41,78 @@ from config import (
     OUTPUT_CONFIG
 )
 
+logger = logging.getLogger(__name__)
+
+
+class _VerboseAdapter(logging.LoggerAdapter):
+    """Per-pipeline view of the module logger that drops progress below WARNING unless verbose"""
+    
+    def __init__(self, logger: logging.Logger, verbose: bool):
+        super().__init__(logger, {})
+        self.verbose = verbose
+    
+    def isEnabledFor(self, level: int) -> bool:
+        if level < logging.WARNING and not self.verbose:
+            return False
+        return self.logger.isEnabledFor(level)
+
+
+def _preview(text: str, n: int = 200) -> str:
+    """First n characters of text, with '...' appended if it was cut"""
+    return text if len(text) <= n else text[:n] + '...'
+
+
+def _iter_prefetched(pool: ThreadPoolExecutor, fn, items, prefetch: int):
+    """
+    Yield fn(item) for each item, in order, running at most prefetch calls ahead
+    
+    Args:
+        pool: Executor the calls run on
+        fn: Function applied to each item
+        items: Iterable of inputs
+        prefetch: Maximum number of finished or running calls not yet consumed
+        
+    Yields:
+        Result of fn for each item
+    """
+    items = iter(items)
+    pending = deque(pool.submit(fn, item) for item in itertools.islice(items, prefetch))
+    while pending:
+        result = pending.popleft().result()
+        # Keep the queue full while the caller works on this result
+        for item in itertools.islice(items, 1):
+            pending.append(pool.submit(fn, item))
+        yield result
+
+
+def _load_asr(model_name: str, device: Optional[str], dtype=None) -> IndicASR:
+    """Build an IndicASR from the config; weights are shared through asr_module's cache"""
+    return IndicASR(
+        model_name=model_name,
+        device=device,
+        sampling_rate=ASR_MODEL_CONFIG['sampling_rate'],
+        int8_cpu=ASR_MODEL_CONFIG['int8_cpu'],
+        dtype=dtype
+    )
+
+
+def _load_nmt(model_name: str, device: Optional[str], dtype=None) -> IndicTranslator:
+    """Build an IndicTranslator from the config; weights are shared through nmt_module's cache"""
+    return IndicTranslator(
+        model_name=model_name,
+        device=device,
+        max_length=NMT_MODEL_CONFIG['max_length'],
+        backend=NMT_MODEL_CONFIG['backend'],
+        quantization=NMT_MODEL_CONFIG['quantization'],
+        ct2_model_dir=NMT_MODEL_CONFIG['ct2_model_dir'],
+        onnx_model_dir=NMT_MODEL_CONFIG['onnx_model_dir'],
+        token_budget=NMT_MODEL_CONFIG['token_budget'],
+        compile_model=NMT_MODEL_CONFIG['compile'],
+        cache_size=NMT_MODEL_CONFIG['cache_size'],
+        dtype=dtype,
+        int8_cpu=NMT_MODEL_CONFIG['int8_cpu']
+    )
+
 
 class IndicSpeechToEnglishPipeline:
     """
@@ -29,7 +123,11 @@ class IndicSpeechToEnglishPipeline:
         self,
         language_code: str,
         device: Optional[str] = None,
-        load_models: bool = True
+        load_models: bool = True,
+        asr_model: Optional[IndicASR] = None,
+        nmt_model: Optional[IndicTranslator] = None,
+        dtype: Optional[torch.dtype] = None,
+        verbose: bool = True
     ):
         """
         Initialize the pipeline
@@ -38,6 +136,12 @@ class IndicSpeechToEnglishPipeline:
             language_code: Language code (e.g., 'hi' for Hindi, 'ta' for Tamil)
             device: Device to run models on ('cuda', 'cpu', or None for auto)
             load_models: Whether to load models immediately
+            asr_model: Already loaded ASR model to share instead of loading one
+            nmt_model: Already loaded NMT model to share instead of loading one
+            dtype: Precision for both models (default: float16 on CUDA,
+                float32 on CPU; torch.bfloat16 on Ampere+ GPUs or BF16 CPUs)
+            verbose: Log progress at INFO level (warnings and errors only if
+                False); shown once the application configures logging
         """
         if language_code not in SUPPORTED_LANGUAGES:
             raise ValueError(
@@ -48,60 +152,89 @@ class IndicSpeechToEnglishPipeline:
         self.language_code = language_code
         self.language_info = SUPPORTED_LANGUAGES[language_code]
         self.device = device
+        self.dtype = dtype
+        # Verbosity is per pipeline; handlers and levels are left to the application
+        self.verbose = verbose
+        self._log = _VerboseAdapter(logger, verbose)
         
-        print("=" * 70)
-        print(f"Initializing Indic Speech-to-English Pipeline")
-        print(f"   Language: {self.language_info['name']} ({language_code})")
-        print(f"   Script: {self.language_info['script']}")
-        print("=" * 70)
+        self._log.info(
+            "Initializing Indic Speech-to-English Pipeline: %s (%s), %s script",
+            self.language_info['name'], language_code, self.language_info['script']
+        )
         
-        self.asr_model = None
-        self.nmt_model = None
+        self.asr_model = asr_model
+        self.nmt_model = nmt_model
         
         if load_models:
             self.load_models()
     
     def load_models(self):
-        """Load ASR and NMT models"""
-        print("\nLoading models...")
+        """Load ASR and NMT models, reusing any shared models passed in"""
+        self._log.info("Loading models...")
         
         # Load ASR model
-        print("\n[1/2] Loading ASR Model")
-        self.asr_model = IndicASR(
-            model_name=self.language_info['asr_model'],
-            device=self.device,
-            sampling_rate=ASR_MODEL_CONFIG['sampling_rate']
-        )
+        if self.asr_model is not None:
+            self._log.info("[1/2] Using shared ASR Model")
+        else:
+            self._log.info("[1/2] Loading ASR Model")
+            self.asr_model = _load_asr(
+                self.language_info['asr_model'], self.device, self.dtype
+            )
         
         # Load NMT model only if not English
         if self.language_code == 'en':
-            print("\n[2/2] Skipping NMT Model (English - no translation needed)")
+            self._log.info("[2/2] Skipping NMT Model (English - no translation needed)")
             self.nmt_model = None
+        elif self.nmt_model is not None:
+            self._log.info("[2/2] Using shared NMT Model")
         else:
-            print("\n[2/2] Loading NMT Model")
-            self.nmt_model = IndicTranslator(
-                model_name=NMT_MODEL_CONFIG['model_name'],
-                device=self.device,
-                max_length=NMT_MODEL_CONFIG['max_length']
+            self._log.info("[2/2] Loading NMT Model")
+            self.nmt_model = _load_nmt(
+                NMT_MODEL_CONFIG['model_name'], self.device, self.dtype
             )
         
-        print("\nAll models loaded successfully!")
+        self._log.info("All models loaded successfully!")
+    
+    def release(self):
+        """
+        Drop this pipeline's references to its models
+        
+        The ASR/NMT weight caches hold weights weakly, so weights no other
+        pipeline uses are freed; other pipelines keep theirs.
+        """
+        self.asr_model = None
+        self.nmt_model = None
+        gc.collect()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
     
     def process(
         self,
-        audio_path: str,
+        audio_path: Optional[Union[str, Tuple[np.ndarray, int]]] = None,
         output_dir: Optional[str] = None,
         save_intermediate: bool = True,
-        verbose: bool = True
+        verbose: bool = True,
+        audio_array: Optional[np.ndarray] = None,
+        sampling_rate: Optional[int] = None,
+        timestamp: Optional[datetime] = None,
+        batch_size: Optional[int] = None
     ) -> Dict[str, str]:
         """
         Process audio file through the complete pipeline
         
         Args:
-            audio_path: Path to input audio file
+            audio_path: Path to input audio file, or an already decoded
+                (waveform, sampling_rate) tuple
             output_dir: Directory to save outputs (optional)
             save_intermediate: Whether to save ASR output
             verbose: Whether to print detailed progress
+            audio_array: Already decoded waveform, used instead of reading
+                audio_path (which then only labels the result)
+            sampling_rate: Sampling rate of audio_array
+            timestamp: Time recorded in the result (default: now); batches
+                pass one shared timestamp
+            batch_size: Inputs per ASR segment / NMT forward (default: ASR
+                batch size from config, NMT token budget)
             
         Returns:
             Dictionary containing:
@@ -115,56 +248,78 @@ class IndicSpeechToEnglishPipeline:
             raise RuntimeError("Models not loaded. Call load_models() first.")
         if not self.nmt_model and self.language_code != 'en':
             raise RuntimeError("NMT model not loaded. Call load_models() first.")
+        if isinstance(audio_path, tuple):
+            audio_array, sampling_rate = audio_path
+            audio_path = None
+        if audio_path is None and audio_array is None:
+            raise ValueError("Either audio_path or audio_array must be provided")
+        if audio_array is not None and sampling_rate is None:
+            raise ValueError("sampling_rate is required with audio_array")
         
         start_time = time.time()
         
-        print("\n" + "=" * 70)
-        print(f"Starting Pipeline Processing")
-        print(f"   Input: {audio_path}")
-        print("=" * 70)
+        self._log.info("Starting Pipeline Processing: %s", audio_path or 'in-memory audio')
         
         # Stage 1: ASR (Speech to Indic Text)
-        print("\n" + "─" * 70)
-        print("STAGE 1: Automatic Speech Recognition (ASR)")
-        print("─" * 70)
+        self._log.info("STAGE 1: Automatic Speech Recognition (ASR)")
         
         asr_start = time.time()
-        indic_text = self.asr_model.transcribe(
-            audio_path,
-            language_code=self.language_code
-        )
+        if audio_array is not None:
+            audio_input = self.asr_model.preprocess_audio(audio_array, sampling_rate)
+        else:
+            audio_input = audio_path
+        # IndicConformer runs segments one by one, so only Whisper gains from VAD
+        if ASR_MODEL_CONFIG['vad'] and self.asr_model.is_whisper:
+            indic_text = self.asr_model.transcribe_segmented(
+                audio_input,
+                language_code=self.language_code,
+                max_segment_s=ASR_MODEL_CONFIG['chunk_length_s'],
+                batch_size=batch_size or ASR_MODEL_CONFIG['batch_size']
+            )
+        else:
+            indic_text = self.asr_model.transcribe(
+                audio_input,
+                language_code=self.language_code,
+                chunk_length_s=ASR_MODEL_CONFIG['chunk_length_s']
+            )
         asr_time = time.time() - asr_start
         
-        if verbose:
-            print(f"\nTranscribed Text ({self.language_info['script']}):")
-            print(f"   {indic_text[:200]}{'...' if len(indic_text) > 200 else ''}")
-            print(f"\nASR Time: {asr_time:.2f}s")
+        if verbose and self._log.isEnabledFor(logging.INFO):
+            self._log.info(
+                "Transcribed Text (%s): %s",
+                self.language_info['script'], _preview(indic_text)
+            )
+            self._log.info("ASR Time: %.2fs", asr_time)
         
         # Stage 2: NMT (Indic Text to English) - Skip for English
         if self.language_code == 'en':
             # For English, skip translation
-            print("\n" + "─" * 70)
-            print("STAGE 2: Neural Machine Translation (NMT) - SKIPPED (English)")
-            print("─" * 70)
+            self._log.info("STAGE 2: Neural Machine Translation (NMT) - SKIPPED (English)")
             english_text = indic_text
             nmt_time = 0.0
-            print("\nUsing transcription directly as English text")
+            self._log.info("Using transcription directly as English text")
+        elif not indic_text.strip():
+            # Silence or a failed decode: nothing to translate
+            self._log.info("STAGE 2: Neural Machine Translation (NMT) - SKIPPED (empty transcript)")
+            english_text = ""
+            nmt_time = 0.0
         else:
-            print("\n" + "─" * 70)
-            print("STAGE 2: Neural Machine Translation (NMT)")
-            print("─" * 70)
+            self._log.info("STAGE 2: Neural Machine Translation (NMT)")
             
             nmt_start = time.time()
             english_text = self.nmt_model.translate_sentences(
                 indic_text,
-                source_lang=self.language_info['flores_code']
+                source_lang=self.language_info['flores_code'],
+                num_beams=NMT_MODEL_CONFIG['num_beams'],
+                batch_size=batch_size
             )
             nmt_time = time.time() - nmt_start
             
-            if verbose:
-                print(f"\nTranslated Text (English):")
-                print(f"   {english_text[:200]}{'...' if len(english_text) > 200 else ''}")
-                print(f"\nNMT Time: {nmt_time:.2f}s")
+            if verbose and self._log.isEnabledFor(logging.INFO):
+                self._log.info(
+                    "Translated Text (English): %s", _preview(english_text)
+                )
+                self._log.info("NMT Time: %.2fs", nmt_time)
         
         total_time = time.time() - start_time
         
@@ -183,53 +338,313 @@ class IndicSpeechToEnglishPipeline:
                 "nmt": round(nmt_time, 2),
                 "total": round(total_time, 2)
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": (timestamp or datetime.now()).isoformat()
         }
         
         # Save outputs if directory specified
         if output_dir:
             self._save_outputs(result, output_dir, save_intermediate)
         
-        print("\n" + "=" * 70)
-        print("Pipeline Processing Complete!")
-        print(f"   Total Time: {total_time:.2f}s")
-        print("=" * 70)
+        self._log.info("Pipeline Processing Complete! Total Time: %.2fs", total_time)
         
         return result
     
     def process_batch(
         self,
         audio_paths: List[str],
-        output_dir: Optional[str] = None
-    ) -> List[Dict[str, str]]:
+        output_dir: Optional[str] = None,
+        decode_workers: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        return_frame: bool = False
+    ) -> Union[List[Dict[str, str]], "pd.DataFrame"]:
         """
         Process multiple audio files
         
+        ASR streams through the files while NMT translates the transcripts
+        queued so far, so the two stages overlap; batch-wide timings are
+        divided evenly per file and marked "averaged". On CPU with
+        IndicConformer, files instead run concurrently on a thread pool and
+        are timed individually. If the batched path fails, files are
+        processed one at a time so per-file errors are reported.
+        
         Args:
             audio_paths: List of audio file paths
-            output_dir: Directory to save outputs
+            output_dir: Directory for the batch JSON Lines file, written the
+                same way by every path
+            decode_workers: Processes for audio decoding (default from config)
+            batch_size: Inputs per ASR / NMT forward; raise until memory runs
+                out (default: ASR batch size from config, NMT token budget)
+            return_frame: Return a columnar pandas DataFrame (one row per
+                file, float32 timing columns) instead of a list of dicts
             
         Returns:
-            List of result dictionaries
+            List of result dictionaries, or a DataFrame if return_frame
         """
-        results = []
+        if not self.asr_model:
+            raise RuntimeError("Models not loaded. Call load_models() first.")
+        if not self.nmt_model and self.language_code != 'en':
+            raise RuntimeError("NMT model not loaded. Call load_models() first.")
+        
+        self._log.info("Processing %d audio files...", len(audio_paths))
+        
+        if decode_workers is None:
+            decode_workers = ASR_MODEL_CONFIG['decode_workers']
+        workers = self._file_workers(len(audio_paths))
+        if workers > 1:
+            # IndicConformer's batch ASR runs one file at a time, so on CPU
+            # concurrent per-file forwards keep more cores busy
+            results = self._process_each(audio_paths, output_dir, workers, decode_workers, batch_size)
+        else:
+            try:
+                results = self._process_batched(audio_paths, output_dir, decode_workers, batch_size)
+            except Exception as e:
+                self._log.warning("Batched processing failed (%s), falling back to per-file processing", e)
+                results = self._process_each(audio_paths, output_dir, 1, decode_workers, batch_size)
+        
+        if return_frame:
+            return _results_frame(results)
+        return results
+    
+    def _file_workers(self, n_files: int) -> int:
+        """
+        Number of files process_batch runs concurrently
+        
+        Only CPU IndicConformer benefits; Whisper and CUDA already batch.
+        
+        Args:
+            n_files: Number of files in the batch
+            
+        Returns:
+            Worker count, 1 for the batched path
+        """
+        if self.asr_model.device != 'cpu' or self.asr_model.is_whisper:
+            return 1
+        return max(1, min(n_files, ASR_MODEL_CONFIG['cpu_file_workers'], os.cpu_count() or 1))
+    
+    def _process_each(
+        self,
+        audio_paths: List[str],
+        output_dir: Optional[str] = None,
+        workers: int = 1,
+        decode_workers: int = 0,
+        batch_size: Optional[int] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Process files individually, recording per-file errors
         
-        print(f"\nProcessing {len(audio_paths)} audio files...")
+        With several workers, files run at once on a thread pool sharing the
+        loaded weights (PyTorch releases the GIL inside ops), splitting the
+        current intra-op thread count between them; NMT calls are serialized
+        by the translator.
         
-        for i, audio_path in enumerate(audio_paths, 1):
-            print(f"\n{'=' * 70}")
-            print(f"Processing file {i}/{len(audio_paths)}")
-            print(f"{'=' * 70}")
+        Args:
+            audio_paths: List of audio file paths
+            output_dir: Directory to save the batch JSON Lines file
+            workers: Files processed concurrently
+            decode_workers: Processes for audio decoding (0 decodes on threads)
+            batch_size: Inputs per ASR / NMT forward, passed to process
             
+        Returns:
+            List of result dictionaries, in input order
+        """
+        # One clock read stamps every result and names the batch file
+        batch_ts = datetime.now()
+        
+        def process_one(audio_path: str, audio) -> Dict[str, str]:
             try:
-                result = self.process(audio_path, output_dir)
-                results.append(result)
+                if audio is None:
+                    # soundfile could not decode it; let the ASR loader try
+                    return self.process(audio_path, timestamp=batch_ts, batch_size=batch_size)
+                return self.process(
+                    audio_path,
+                    audio_array=audio[0],
+                    sampling_rate=audio[1],
+                    timestamp=batch_ts,
+                    batch_size=batch_size
+                )
             except Exception as e:
-                print(f"Error processing {audio_path}: {str(e)}")
-                results.append({
+                self._log.error("Error processing %s: %s", audio_path, e)
+                return {
                     "audio_path": audio_path,
                     "error": str(e)
-                })
+                }
+        
+        # Split the current intra-op budget (e.g. the backend's configure_cpu_threads)
+        # between the workers, restored once the batch is done
+        previous_threads = torch.get_num_threads()
+        threads = max(1, previous_threads // workers)
+        torch.set_num_threads(threads)
+        
+        # Only a few decoded files wait in memory at a time, as in IndicASR._iter_loaded
+        prefetch = max(4, workers)
+        show_progress = self._log.isEnabledFor(logging.INFO)
+        try:
+            # Decode upcoming files on threads (or spawned processes, which never
+            # import torch) while the models work on earlier ones
+            if decode_workers > 0:
+                decode_executor = ProcessPoolExecutor(
+                    max_workers=decode_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                decode_executor = ThreadPoolExecutor(max_workers=min(prefetch, os.cpu_count() or 1))
+            with decode_executor as decode_pool, \
+                    ThreadPoolExecutor(
+                        max_workers=workers,
+                        initializer=torch.set_num_threads,
+                        initargs=(threads,)
+                    ) as pool:
+                decoded = _iter_prefetched(decode_pool, decode_audio, audio_paths, prefetch)
+                files = zip(audio_paths, decoded)
+                results = []
+                with tqdm(total=len(audio_paths), desc="Processing files", disable=not show_progress) as progress:
+                    if workers == 1:
+                        # Each file is processed as soon as it is decoded
+                        for audio_path, audio in files:
+                            results.append(process_one(audio_path, audio))
+                            progress.update()
+                    else:
+                        # At most one file per worker is in flight, collected in input order
+                        pending = deque(
+                            pool.submit(process_one, audio_path, audio)
+                            for audio_path, audio in itertools.islice(files, workers)
+                        )
+                        while pending:
+                            results.append(pending.popleft().result())
+                            progress.update()
+                            for audio_path, audio in itertools.islice(files, 1):
+                                pending.append(pool.submit(process_one, audio_path, audio))
+        finally:
+            torch.set_num_threads(previous_threads)
+        
+        if output_dir:
+            # Same JSON Lines output as the batched path, error entries included
+            self._save_outputs_batch(results, output_dir, batch_ts)
+        
+        return results
+    
+    def _process_batched(
+        self,
+        audio_paths: List[str],
+        output_dir: Optional[str] = None,
+        decode_workers: Optional[int] = None,
+        batch_size: Optional[int] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Run ASR and NMT over all files, overlapping the two stages
+        
+        A producer thread streams files through ASR and queues each
+        transcript; this thread translates whatever has queued up each time
+        NMT is free, so NMT of early files runs while later files are in ASR
+        and transcripts still share length-bucketed batches. On CUDA each
+        stage issues its kernels on its own stream so the two can overlap.
+        The stages overlap, so per-file timings can't be measured; each
+        result gets the batch totals divided by the file count, with
+        processing_time["averaged"] set.
+        """
+        start_time = time.time()
+        
+        cuda = self.asr_model.device == 'cuda'
+        asr_stream = torch.cuda.Stream() if cuda else None
+        nmt_stream = torch.cuda.Stream() if cuda else None
+        transcripts = queue.Queue()
+        stop = threading.Event()
+        done = object()
+        
+        # Stage 1: ASR over all files, in a producer thread
+        def run_asr() -> float:
+            asr_start = time.time()
+            try:
+                with torch.cuda.stream(asr_stream) if cuda else nullcontext():
+                    for indic_text in self.asr_model.transcribe_iter(
+                        audio_paths,
+                        chunk_length_s=ASR_MODEL_CONFIG['chunk_length_s'],
+                        language_code=self.language_code,
+                        decode_workers=ASR_MODEL_CONFIG['decode_workers'] if decode_workers is None else decode_workers,
+                        batch_size=batch_size or ASR_MODEL_CONFIG['batch_size']
+                    ):
+                        transcripts.put(indic_text)
+                        if stop.is_set():
+                            break
+            finally:
+                transcripts.put(done)
+            return time.time() - asr_start
+        
+        # Stage 2: NMT over queued transcripts - Skip for English
+        indic_texts = []
+        english_texts = []
+        nmt_time = 0.0
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            asr_future = executor.submit(run_asr)
+            try:
+                finished = False
+                while not finished:
+                    group = [transcripts.get()]
+                    while group[-1] is not done:
+                        try:
+                            group.append(transcripts.get_nowait())
+                        except queue.Empty:
+                            break
+                    if group[-1] is done:
+                        finished = True
+                        group.pop()
+                    if not group:
+                        continue
+                    
+                    indic_texts.extend(group)
+                    nmt_start = time.time()
+                    if self.language_code == 'en':
+                        english_texts.extend(group)
+                    else:
+                        # Sentences from every queued file go into one translate()
+                        # call, which sorts them by token length and batches them
+                        with torch.cuda.stream(nmt_stream) if cuda else nullcontext():
+                            english_texts.extend(self.nmt_model.translate_documents(
+                                group,
+                                source_lang=self.language_info['flores_code'],
+                                batch_size=batch_size,
+                                num_beams=NMT_MODEL_CONFIG['num_beams']
+                            ))
+                    nmt_time += time.time() - nmt_start
+            finally:
+                stop.set()
+            # Re-raises any ASR failure
+            asr_time = asr_future.result()
+        
+        if cuda:
+            torch.cuda.synchronize()
+        
+        total_time = time.time() - start_time
+        count = max(len(audio_paths), 1)
+        # One clock read stamps every result and names the batch file
+        batch_ts = datetime.now()
+        timestamp = batch_ts.isoformat()
+        
+        results = []
+        for audio_path, indic_text, english_text in zip(audio_paths, indic_texts, english_texts):
+            result = {
+                "audio_path": audio_path,
+                "language": {
+                    "code": self.language_code,
+                    "name": self.language_info['name'],
+                    "script": self.language_info['script']
+                },
+                "indic_text": indic_text,
+                "english_text": english_text,
+                "processing_time": {
+                    "asr": round(asr_time / count, 2),
+                    "nmt": round(nmt_time / count, 2),
+                    "total": round(total_time / count, 2),
+                    "averaged": True
+                },
+                "timestamp": timestamp
+            }
+            results.append(result)
+        
+        if output_dir:
+            self._save_outputs_batch(results, output_dir, batch_ts)
+        
+        self._log.info("Batch Processing Complete! Total Time: %.2fs", total_time)
         
         return results
     
@@ -237,35 +652,96 @@ class IndicSpeechToEnglishPipeline:
         self,
         result: Dict,
         output_dir: str,
-        save_intermediate: bool
+        save_intermediate: bool,
+        ts: Optional[datetime] = None,
+        idx: Optional[int] = None
     ):
-        """Save processing results to files"""
+        """
+        Save processing results to files
+        
+        Args:
+            result: Result dictionary from process
+            output_dir: Directory to save outputs
+            save_intermediate: Whether to save ASR output
+            ts: Shared batch timestamp for the filename (default: now)
+            idx: Position in the batch, appended so shared timestamps stay unique
+        """
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
         # Generate base filename from audio file
-        audio_name = Path(result['audio_path']).stem
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        audio_name = Path(result['audio_path']).stem if result['audio_path'] else "audio"
+        timestamp = (ts or datetime.now()).strftime("%Y%m%d_%H%M%S")
         base_name = f"{audio_name}_{timestamp}"
+        if idx is not None:
+            base_name = f"{base_name}_{idx:05d}"
         
         # Save complete result as JSON
         json_path = output_path / f"{base_name}_result.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
-        print(f"\nSaved JSON result: {json_path}")
+        if orjson is not None:
+            with open(json_path, 'wb') as f:
+                f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False, indent=2)
+        self._log.info("Saved JSON result: %s", json_path)
         
         # Save intermediate ASR output if requested
         if save_intermediate:
             indic_path = output_path / f"{base_name}_indic.txt"
-            with open(indic_path, 'w', encoding='utf-8') as f:
-                f.write(result['indic_text'])
-            print(f"Saved Indic text: {indic_path}")
+            # Encode once and write the bytes in a single call, bypassing TextIOWrapper
+            indic_path.write_bytes(result['indic_text'].encode('utf-8'))
+            self._log.info("Saved Indic text: %s", indic_path)
         
         # Save final English translation
         english_path = output_path / f"{base_name}_english.txt"
-        with open(english_path, 'w', encoding='utf-8') as f:
-            f.write(result['english_text'])
-        print(f"Saved English text: {english_path}")
+        english_path.write_bytes(result['english_text'].encode('utf-8'))
+        self._log.info("Saved English text: %s", english_path)
+    
+    def _save_outputs_batch(
+        self,
+        results: List[Dict],
+        output_dir: str,
+        ts: Optional[datetime] = None
+    ):
+        """
+        Save a batch of results as one JSON Lines file, one result per line
+        
+        Each line holds the full result (including indic_text and
+        english_text), so a batch costs one file open instead of three per file.
+        
+        Args:
+            results: Result dictionaries from process_batch
+            output_dir: Directory to save outputs
+            ts: Batch timestamp for the filename (default: now)
+            
+        Returns:
+            Path of the written file
+        """
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        
+        timestamp = (ts or datetime.now()).strftime("%Y%m%d_%H%M%S")
+        # Exclusive create, so batches finishing within the same second get a
+        # numbered name instead of overwriting each other
+        for n in itertools.count():
+            suffix = f"_{n}" if n else ""
+            jsonl_path = output_path / f"batch_{timestamp}{suffix}_results.jsonl"
+            try:
+                f = open(jsonl_path, 'xb')
+                break
+            except FileExistsError:
+                continue
+        with f:
+            if orjson is not None:
+                f.writelines(orjson.dumps(result) + b"\n" for result in results)
+            else:
+                f.writelines(
+                    (json.dumps(result, ensure_ascii=False) + "\n").encode('utf-8')
+                    for result in results
+                )
+        self._log.info("Saved batch results: %s", jsonl_path)
+        return jsonl_path
     
     def __repr__(self):
         return (
@@ -275,6 +751,51 @@ class IndicSpeechToEnglishPipeline:
         )
 
 
+def _results_frame(results: List[Dict]) -> "pd.DataFrame":
+    """
+    Convert process_batch results to a columnar DataFrame
+    
+    Args:
+        results: Result dictionaries, possibly including error entries
+        
+    Returns:
+        DataFrame with one row per file; text columns use the string dtype
+        (Arrow-backed when pyarrow is installed) and timings are float32
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        raise RuntimeError(
+            "return_frame requires pandas. "
+            "Install with: pip install pandas"
+        )
+    try:
+        import pyarrow  # noqa: F401
+        text_dtype = pd.StringDtype("pyarrow")
+    except ImportError:
+        text_dtype = pd.StringDtype()
+    
+    times = {"asr_time": [], "nmt_time": [], "total_time": []}
+    for result in results:
+        timing = result.get("processing_time", {})
+        times["asr_time"].append(timing.get("asr", np.nan))
+        times["nmt_time"].append(timing.get("nmt", np.nan))
+        times["total_time"].append(timing.get("total", np.nan))
+    
+    text_columns = {
+        "audio_path": [r.get("audio_path") for r in results],
+        "language_code": [r.get("language", {}).get("code") for r in results],
+        "indic_text": [r.get("indic_text") for r in results],
+        "english_text": [r.get("english_text") for r in results],
+        "timestamp": [r.get("timestamp") for r in results],
+        "error": [r.get("error") for r in results],
+    }
+    return pd.DataFrame({
+        **{name: pd.array(values, dtype=text_dtype) for name, values in text_columns.items()},
+        **{name: np.asarray(values, dtype=np.float32) for name, values in times.items()},
+    })
+
+
 def list_supported_languages():
     """Print all supported languages"""
     print("\nSupported Indic Languages:")
@@ -14,7 +14,8 @@ try:
     print("Initializing model...")
     translator = IndicTranslator(
         model_name="facebook/nllb-200-distilled-600M",
-        device="cpu"
+        device="cpu",
+        int8_cpu=True
     )
     
     print("Model initialized successfully.")
@@ -0,0 +1,83 @@
+"""
+Unit tests for the pause-based segmentation in asr_module._vad_segments
+Run with: python -m pytest test_vad.py
+"""
+
+import numpy as np
+
+from asr_module import _vad_segments
+
+SR = 16000
+
+
+def _signal(*parts):
+    """Build a waveform from (seconds, voiced) parts"""
+    rng = np.random.default_rng(0)
+    chunks = []
+    for seconds, voiced in parts:
+        n = int(seconds * SR)
+        if voiced:
+            chunks.append(rng.uniform(-0.5, 0.5, n).astype(np.float32))
+        else:
+            chunks.append(np.zeros(n, dtype=np.float32))
+    return np.concatenate(chunks)
+
+
+def _durations(segments):
+    return [len(segment) / SR for segment in segments]
+
+
+def test_silence_returns_whole_input():
+    audio = np.zeros(SR, dtype=np.float32)
+    segments = _vad_segments(audio, SR)
+    assert len(segments) == 1
+    assert len(segments[0]) == len(audio)
+
+
+def test_max_length_run_is_one_segment():
+    # A 30.0s run must not leave a one-frame sliver behind
+    segments = _vad_segments(_signal((30.0, True)), SR, max_segment_s=30)
+    assert len(segments) == 1
+    assert abs(_durations(segments)[0] - 30.0) < 0.05
+
+
+def test_short_pause_stays_inside_segment():
+    audio = _signal((5, True), (0.1, False), (5, True))
+    segments = _vad_segments(audio, SR)
+    assert len(segments) == 1
+
+
+def test_long_silence_is_not_packed():
+    # Runs at 41-45s and 60-69s are 15s apart and must stay separate
+    audio = _signal((41, False), (4, True), (15, False), (9, True))
+    durations = _durations(_vad_segments(audio, SR))
+    assert len(durations) == 2
+    assert all(d < 10 for d in durations)
+
+
+def test_medium_pauses_are_packed_up_to_max_length():
+    audio = _signal(*[(4, True), (0.5, False)] * 10)
+    durations = _durations(_vad_segments(audio, SR, max_segment_s=30))
+    assert len(durations) == 2
+    assert all(d <= 30 for d in durations)
+
+
+def test_short_tail_is_merged_into_previous_segment():
+    audio = _signal((5, True), (2, False), (0.1, True))
+    segments = _vad_segments(audio, SR)
+    assert len(segments) == 1
+    assert _durations(segments)[0] > 7
+
+
+def test_pauseless_run_is_left_for_the_caller_to_window():
+    segments = _vad_segments(_signal((70, True)), SR, max_segment_s=30)
+    assert len(segments) == 1
+    assert abs(_durations(segments)[0] - 70) < 0.05
+
+
+def test_segments_are_views_in_order():
+    audio = _signal((3, True), (2, False), (3, True))
+    segments = _vad_segments(audio, SR)
+    assert len(segments) == 2
+    assert all(np.shares_memory(segment, audio) for segment in segments)
+    assert segments[0].ctypes.data < segments[1].ctypes.data